@@ -5,15 +5,18 @@ Optimized for 1024x768 resolution
 """
 
 import pygame
+import numpy as np
 import random
 import math
 import sys
 import json
 import os
 import hashlib
-from dataclasses import dataclass, asdict
+import hmac
+from dataclasses import dataclass, asdict, fields
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
+from collections import OrderedDict
 from datetime import datetime
 
 pygame.init()
@@ -23,6 +26,7 @@ SCREEN_HEIGHT = 768
 CANVAS_WIDTH = 650
 CANVAS_HEIGHT = 500
 FPS = 60
+MAX_PARTICLE_SIZE = 4
 
 BG_DARK = (10, 14, 26)
 BG_CARD = (18, 23, 40)
@@ -39,6 +43,14 @@ COLOR_SUCCESS = (34, 197, 94)
 GLASS_BG = (20, 25, 40, 100)
 GLASS_BORDER = (64, 224, 208, 40)
 
+PROCEDURAL_DIFFICULTIES = ('Easy', 'Medium', 'Hard', 'Expert')
+PROCEDURAL_DIFFICULTY_INDEX = tuple((i // 3) % 4 for i in range(12))
+
+SIN_TABLE_SIZE = 2048
+SIN_TABLE_MASK = SIN_TABLE_SIZE - 1
+SIN_TABLE_SCALE = SIN_TABLE_SIZE / (2 * math.pi)
+SIN_TABLE = [math.sin(i / SIN_TABLE_SCALE) for i in range(SIN_TABLE_SIZE)]
+
 class GameState(Enum):
     LOGIN = 0
     REGISTER = 1
@@ -48,6 +60,14 @@ class GameState(Enum):
     SETTINGS_SCREEN = 5
     LEADERBOARD_SCREEN = 6
 
+STATIC_STATES = frozenset({
+    GameState.LOGIN,
+    GameState.REGISTER,
+    GameState.MAPS_SCREEN,
+    GameState.SETTINGS_SCREEN,
+    GameState.LEADERBOARD_SCREEN,
+})
+
 class MapsTab(Enum):
     CURATED = 1
     PROCEDURAL = 2
@@ -110,23 +130,28 @@ class DataManager:
         self.leaderboard: List[LeaderboardEntry] = []
         self.load_data()
     
-    def hash_password(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
+    def hash_password(self, password: str, salt: str = "") -> str:
+        if not salt:
+            return hashlib.sha256(password.encode()).hexdigest()
+        digest = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=2**14, r=8, p=1, dklen=32).hex()
+        return f"scrypt${salt}${digest}"
     
     def load_data(self):
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
+                with open(self.users_file, 'rb') as f:
+                    users_data = json.loads(f.read())
+                    # The final build shares users.json; ignore any keys this build doesn't know
+                    known = {field.name for field in fields(User)}
                     for username, user_data in users_data.items():
-                        self.users[username] = User(**user_data)
+                        self.users[username] = User(**{k: v for k, v in user_data.items() if k in known})
             except Exception as e:
                 print(f"Error loading users: {e}")
         
         if os.path.exists(self.leaderboard_file):
             try:
-                with open(self.leaderboard_file, 'r') as f:
-                    leaderboard_data = json.load(f)
+                with open(self.leaderboard_file, 'rb') as f:
+                    leaderboard_data = json.loads(f.read())
                     self.leaderboard = [LeaderboardEntry(**entry) for entry in leaderboard_data]
                     self.leaderboard.sort(key=lambda x: x.score, reverse=True)
             except Exception as e:
@@ -166,8 +191,10 @@ class DataManager:
         if username not in self.users:
             return False, "Username not found"
         
-        password_hash = self.hash_password(password)
-        if self.users[username].password_hash != password_hash:
+        # Accounts registered by the final build are stored as 'scrypt$<salt>$<digest>'
+        stored = self.users[username].password_hash
+        salt = stored.split("$")[1] if stored.startswith("scrypt$") else ""
+        if not hmac.compare_digest(stored, self.hash_password(password, salt)):
             return False, "Incorrect password"
         
         return True, "Login successful!"
@@ -219,6 +246,7 @@ class BlockSmasher:
         self.settings = Settings()
         
         self.current_level = 1
+        self._level_text = "Level 1"
         self.score = 0
         self.lives = 3
         self.paddle_x = CANVAS_WIDTH // 2 - 60
@@ -241,6 +269,101 @@ class BlockSmasher:
         
         self.mouse_x, self.mouse_y = pygame.mouse.get_pos()
         self.mouse_clicked = False
+        self._dirty = True
+        self._drawn_state: Optional[GameState] = None
+        
+        self._text_cache: OrderedDict = OrderedDict()
+        self._hud_cache: Optional[pygame.Surface] = None
+        self._hud_key = None
+        self._fps_cache: Optional[pygame.Surface] = None
+        self._fps_key = None
+        self._podium_surface: Optional[pygame.Surface] = None
+        self._podium_key = None
+        self._top_scores = None
+        self._leaderboard_row_cache: Dict[tuple, pygame.Surface] = {}
+        
+        self._menu_bg_surface: Optional[pygame.Surface] = None
+        
+        self._login_rects = self.layout_auth_card(340, 150, 235)
+        self._register_rects = self.layout_auth_card(380, 160, 265)
+        self._back_rect = pygame.Rect(40, 80, 120, 38)
+        self._curated_tab_rect = pygame.Rect(190, 80, 170, 38)
+        self._procedural_tab_rect = pygame.Rect(380, 80, 190, 38)
+        self._pause_rect = pygame.Rect(40, 60, 55, 38)
+        self._overlay_button_rects = (pygame.Rect(SCREEN_WIDTH // 2 - 190, 440, 175, 55),
+                                      pygame.Rect(SCREEN_WIDTH // 2 + 15, 440, 175, 55))
+        self._settings_item_rects = [pygame.Rect(SCREEN_WIDTH // 2 - 230, 170 + i * 70, 460, 56) for i in range(5)]
+        self._curated_card_rects = self.layout_cards(6, 3, 310, 115, 20)
+        self._procedural_card_rects = self.layout_cards(12, 4, 235, 100, 18)
+        
+        self.build_glow_sprites()
+        self._block_sprite_cache: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._particle_sprites: Dict[Tuple[int, int, int], List[Optional[pygame.Surface]]] = {}
+        self._glass_cache: Dict[tuple, pygame.Surface] = {}
+        self._menu_block_cache: Dict[int, Tuple[pygame.Surface, List[pygame.Surface]]] = {}
+        
+        # The two border outlines plus the canvas fill cover the whole frame,
+        # so it can be a single opaque surface.
+        self._canvas_frame = pygame.Surface((CANVAS_WIDTH + 8, CANVAS_HEIGHT + 8))
+        self._canvas_frame.fill((15, 20, 35))
+        for i in range(2):
+            glow_rect = pygame.Rect(2 - i*2, 2 - i*2, CANVAS_WIDTH + 4 + i*4, CANVAS_HEIGHT + 4 + i*4)
+            pygame.draw.rect(self._canvas_frame, (*COLOR_CYAN, 50 - i*20), glow_rect, 2)
+        
+        self._dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._dim_overlay.fill((0, 0, 0, 200))
+        
+        self._title_bar = pygame.Surface((180, 4))
+        self._title_bar.fill(COLOR_CYAN, (0, 0, 60, 4))
+        self._title_bar.fill(COLOR_PURPLE, (60, 0, 59, 4))
+        self._title_bar.fill(COLOR_ORANGE, (119, 0, 61, 4))
+    
+    @property
+    def username_input(self) -> str:
+        if self._username_text is None:
+            self._username_text = "".join(self._username_buf)
+        return self._username_text
+    
+    @username_input.setter
+    def username_input(self, value: str):
+        self._username_buf = list(value)
+        self._username_text = value
+    
+    @property
+    def password_input(self) -> str:
+        if self._password_text is None:
+            self._password_text = "".join(self._password_buf)
+        return self._password_text
+    
+    @password_input.setter
+    def password_input(self, value: str):
+        self._password_buf = list(value)
+        self._password_text = value
+    
+    def layout_auth_card(self, card_height: int, password_offset: int,
+                         button_offset: int) -> Tuple[pygame.Rect, pygame.Rect, pygame.Rect, pygame.Rect]:
+        card_width = 420
+        card_x = SCREEN_WIDTH // 2 - card_width // 2
+        card_y = SCREEN_HEIGHT // 2 - card_height // 2 + 10
+        input_width, input_height = 360, 42
+        input_x = card_x + (card_width - input_width) // 2
+        return (
+            pygame.Rect(input_x, card_y + 65, input_width, input_height),
+            pygame.Rect(input_x, card_y + password_offset, input_width, input_height),
+            pygame.Rect(input_x, card_y + button_offset, 170, 48),
+            pygame.Rect(input_x + 190, card_y + button_offset, 170, 48),
+        )
+    
+    def layout_cards(self, count: int, cols: int, card_width: int, card_height: int,
+                     spacing: int) -> List[Tuple[int, int, pygame.Rect]]:
+        start_x, start_y = 40, 155
+        cards = []
+        for i in range(count):
+            row, col = i // cols, i % cols
+            x = start_x + col * (card_width + spacing)
+            y = start_y + row * (card_height + spacing)
+            cards.append((x, y, pygame.Rect(x, y, card_width, card_height)))
+        return cards
     
     def create_floating_blocks(self):
         return [
@@ -420,8 +543,18 @@ class BlockSmasher:
                 if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
                     blocks.append(Block(x, y, bw, bh, True, color))
     
+    def record_score(self):
+        self.data_manager.add_score(self.current_user, self.score, self.current_level)
+        self._top_scores = None
+    
+    def get_top_scores(self) -> List[LeaderboardEntry]:
+        if self._top_scores is None:
+            self._top_scores = self.data_manager.get_top_scores(10)
+        return self._top_scores
+    
     def start_level(self, level: int):
         self.current_level = level
+        self._level_text = f"Random Level #{level - 99}" if level >= 100 else f"Level {level}"
         self.lives = 3
         self.score = 0
         self.ball_launched = False
@@ -432,9 +565,23 @@ class BlockSmasher:
         self.ball_vy = 0
         self.blocks = self.generate_blocks_for_level(level)
         self.particles = []
+        self._top_scores = None
         self.game_over_type = None
+        self.build_glow_sprites()
         self.state = GameState.GAME_SCREEN
     
+    def build_glow_sprites(self):
+        self._paddle_glow = []
+        self._ball_glow = []
+        for i in range(2):
+            s = pygame.Surface((self.paddle_width + i*3, self.paddle_height + i*3), pygame.SRCALPHA)
+            pygame.draw.rect(s, (*COLOR_PURPLE, 45 - i*15), (0, 0, self.paddle_width + i*3, self.paddle_height + i*3), 1, border_radius=5)
+            self._paddle_glow.append(s)
+            
+            s = pygame.Surface((self.ball_radius*2 + i*3, self.ball_radius*2 + i*3), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*COLOR_CYAN, 70 - i*22), (self.ball_radius + i*1.5, self.ball_radius + i*1.5), self.ball_radius + i*1.5, 1)
+            self._ball_glow.append(s)
+    
     def create_particles(self, x: float, y: float, count: int, color: Tuple[int, int, int]):
         if not self.settings.particle_effects:
             return
@@ -502,7 +649,7 @@ class BlockSmasher:
                 if self.lives <= 0:
                     self.game_over_type = 'defeat'
                     if self.current_user and self.score > 0:
-                        self.data_manager.add_score(self.current_user, self.score, self.current_level)
+                        self.record_score()
                 else:
                     self.ball_launched = False
                     self.ball_vx = 0
@@ -519,36 +666,66 @@ class BlockSmasher:
         if all(not block.alive for block in self.blocks) and not self.game_over_type:
             self.game_over_type = 'victory'
             if self.current_user and self.score > 0:
-                self.data_manager.add_score(self.current_user, self.score, self.current_level)
+                self.record_score()
             
             if self.current_level + 1 not in self.unlocked_levels and self.current_level < 100:
                 self.unlocked_levels.append(self.current_level + 1)
     
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > 256:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+    
     def draw_glow_text(self, text: str, font, color: Tuple[int, int, int], x: int, y: int, center=False):
         for offset in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
-            glow_surf = font.render(text, True, (*color[:3], 80) if len(color) == 3 else color)
+            glow_surf = self.render_text(font, text, (*color[:3], 80) if len(color) == 3 else color)
             rect = glow_surf.get_rect(center=(x + offset[0], y + offset[1])) if center else glow_surf.get_rect(topleft=(x + offset[0], y + offset[1]))
             self.screen.blit(glow_surf, rect)
         
-        text_surf = font.render(text, True, color)
+        text_surf = self.render_text(font, text, color)
         rect = text_surf.get_rect(center=(x, y)) if center else text_surf.get_rect(topleft=(x, y))
         self.screen.blit(text_surf, rect)
         return rect
     
+    def get_glass_surface(self, width: int, height: int, border_color: Tuple[int, int, int],
+                          glow: bool, radius: int) -> pygame.Surface:
+        key = (width, height, border_color, glow, radius)
+        surface = self._glass_cache.get(key)
+        if surface is None:
+            # Layers are composited in premultiplied alpha so that blitting the
+            # result once matches drawing them one after another on screen.
+            layers = []
+            s = pygame.Surface((width, height), pygame.SRCALPHA)
+            s.fill(GLASS_BG)
+            layers.append((s, (2, 2)))
+            
+            if glow:
+                for i in range(2):
+                    s_glow = pygame.Surface((width + i*4, height + i*4), pygame.SRCALPHA)
+                    pygame.draw.rect(s_glow, (*border_color, 25 - i*10), (0, 0, width + i*4, height + i*4), border_radius=radius+i*2)
+                    layers.append((s_glow, (2 - i*2, 2 - i*2)))
+            
+            border = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(border, border_color, (0, 0, width, height), 2, border_radius=radius)
+            layers.append((border, (2, 2)))
+            
+            surface = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+            for layer, pos in layers:
+                surface.blit(layer.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._glass_cache[key] = surface
+        return surface
+    
     def draw_glass_rect(self, x: int, y: int, width: int, height: int, 
                        border_color: Tuple[int, int, int], glow: bool = False, radius: int = 10):
-        s = pygame.Surface((width, height), pygame.SRCALPHA)
-        s.fill(GLASS_BG)
-        self.screen.blit(s, (x, y))
-        
-        if glow:
-            for i in range(2):
-                glow_rect = pygame.Rect(x - i*2, y - i*2, width + i*4, height + i*4)
-                s_glow = pygame.Surface((width + i*4, height + i*4), pygame.SRCALPHA)
-                pygame.draw.rect(s_glow, (*border_color, 25 - i*10), (0, 0, width + i*4, height + i*4), border_radius=radius+i*2)
-                self.screen.blit(s_glow, (x - i*2, y - i*2))
-        
-        pygame.draw.rect(self.screen, border_color, (x, y, width, height), 2, border_radius=radius)
+        self.screen.blit(self.get_glass_surface(width, height, border_color, glow, radius), (x - 2, y - 2),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
     
     def draw_button(self, text: str, x: int, y: int, width: int, height: int,
                    color: Tuple[int, int, int], icon: str = None) -> bool:
@@ -559,11 +736,11 @@ class BlockSmasher:
         
         icon_x = x + 15
         if icon:
-            icon_surf = self.font_small.render(icon, True, color)
+            icon_surf = self.render_text(self.font_small, icon, color)
             self.screen.blit(icon_surf, (icon_x, y + height // 2 - 10))
             icon_x += 32
         
-        text_surf = self.font_medium.render(text, True, color)
+        text_surf = self.render_text(self.font_medium, text, color)
         text_rect = text_surf.get_rect(midleft=(icon_x, y + height // 2))
         self.screen.blit(text_surf, text_rect)
         
@@ -583,7 +760,7 @@ class BlockSmasher:
         
         self.draw_glow_text("BLOCK SMASHER", self.font_title, COLOR_CYAN, SCREEN_WIDTH // 2, 100, center=True)
         
-        subtitle = self.font_small.render("Login to Continue", True, COLOR_FOREGROUND)
+        subtitle = self.render_text(self.font_small, "Login to Continue", COLOR_FOREGROUND)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 165))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -602,12 +779,12 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, username_y, input_width, input_height, 
                            COLOR_CYAN if username_active else COLOR_BORDER, username_active)
         
-        username_label = self.font_small.render("Username:", True, COLOR_FOREGROUND)
+        username_label = self.render_text(self.font_small, "Username:", COLOR_FOREGROUND)
         self.screen.blit(username_label, (input_x, username_y - 25))
         
         username_display = self.username_input if self.username_input else "Enter username..."
-        username_text = self.font_small.render(username_display, True, 
-                                               COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
+        username_text = self.render_text(self.font_small, username_display,
+                                         COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
         self.screen.blit(username_text, (input_x + 12, username_y + 11))
         
         password_y = card_y + 150
@@ -615,17 +792,15 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, password_y, input_width, input_height,
                            COLOR_CYAN if password_active else COLOR_BORDER, password_active)
         
-        password_label = self.font_small.render("Password:", True, COLOR_FOREGROUND)
+        password_label = self.render_text(self.font_small, "Password:", COLOR_FOREGROUND)
         self.screen.blit(password_label, (input_x, password_y - 25))
         
         password_display = "*" * len(self.password_input) if self.password_input else "Enter password..."
-        password_text = self.font_small.render(password_display, True,
-                                               COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
+        password_text = self.render_text(self.font_small, password_display,
+                                         COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
         self.screen.blit(password_text, (input_x + 12, password_y + 11))
         
-        login_btn_y = card_y + 235
-        login_btn_rect = pygame.Rect(input_x, login_btn_y, 170, 48)
-        register_btn_rect = pygame.Rect(input_x + 190, login_btn_y, 170, 48)
+        username_rect, password_rect, login_btn_rect, register_btn_rect = self._login_rects
         
         login_hover = login_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
         register_hover = register_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -635,8 +810,8 @@ class BlockSmasher:
         self.draw_glass_rect(register_btn_rect.x, register_btn_rect.y, register_btn_rect.width, register_btn_rect.height,
                            COLOR_PURPLE, register_hover)
         
-        login_text = self.font_medium.render("LOGIN", True, COLOR_CYAN)
-        register_text = self.font_medium.render("REGISTER", True, COLOR_PURPLE)
+        login_text = self.render_text(self.font_medium, "LOGIN", COLOR_CYAN)
+        register_text = self.render_text(self.font_medium, "REGISTER", COLOR_PURPLE)
         
         login_text_rect = login_text.get_rect(center=login_btn_rect.center)
         register_text_rect = register_text.get_rect(center=register_btn_rect.center)
@@ -658,18 +833,18 @@ class BlockSmasher:
                 self.state = GameState.REGISTER
                 self.error_message = ""
             else:
-                if pygame.Rect(input_x, username_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                if username_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "username"
-                elif pygame.Rect(input_x, password_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                elif password_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "password"
         
         if self.error_message:
-            error_surf = self.font_small.render(self.error_message, True, COLOR_ERROR)
+            error_surf = self.render_text(self.font_small, self.error_message, COLOR_ERROR)
             error_rect = error_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 25))
             self.screen.blit(error_surf, error_rect)
         
         if self.success_message:
-            success_surf = self.font_small.render(self.success_message, True, COLOR_SUCCESS)
+            success_surf = self.render_text(self.font_small, self.success_message, COLOR_SUCCESS)
             success_rect = success_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 25))
             self.screen.blit(success_surf, success_rect)
     
@@ -687,7 +862,7 @@ class BlockSmasher:
         
         self.draw_glow_text("BLOCK SMASHER", self.font_title, COLOR_PURPLE, SCREEN_WIDTH // 2, 100, center=True)
         
-        subtitle = self.font_small.render("Create New Account", True, COLOR_FOREGROUND)
+        subtitle = self.render_text(self.font_small, "Create New Account", COLOR_FOREGROUND)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 165))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -706,12 +881,12 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, username_y, input_width, input_height,
                            COLOR_PURPLE if username_active else COLOR_BORDER, username_active)
         
-        username_label = self.font_small.render("Username (min 3 chars):", True, COLOR_FOREGROUND)
+        username_label = self.render_text(self.font_small, "Username (min 3 chars):", COLOR_FOREGROUND)
         self.screen.blit(username_label, (input_x, username_y - 25))
         
         username_display = self.username_input if self.username_input else "Enter username..."
-        username_text = self.font_small.render(username_display, True,
-                                               COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
+        username_text = self.render_text(self.font_small, username_display,
+                                         COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
         self.screen.blit(username_text, (input_x + 12, username_y + 11))
         
         password_y = card_y + 160
@@ -719,17 +894,15 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, password_y, input_width, input_height,
                            COLOR_PURPLE if password_active else COLOR_BORDER, password_active)
         
-        password_label = self.font_small.render("Password (min 4 chars):", True, COLOR_FOREGROUND)
+        password_label = self.render_text(self.font_small, "Password (min 4 chars):", COLOR_FOREGROUND)
         self.screen.blit(password_label, (input_x, password_y - 25))
         
         password_display = "*" * len(self.password_input) if self.password_input else "Enter password..."
-        password_text = self.font_small.render(password_display, True,
-                                               COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
+        password_text = self.render_text(self.font_small, password_display,
+                                         COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
         self.screen.blit(password_text, (input_x + 12, password_y + 11))
         
-        create_btn_y = card_y + 265
-        create_btn_rect = pygame.Rect(input_x, create_btn_y, 170, 48)
-        back_btn_rect = pygame.Rect(input_x + 190, create_btn_y, 170, 48)
+        username_rect, password_rect, create_btn_rect, back_btn_rect = self._register_rects
         
         create_hover = create_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
         back_hover = back_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -739,8 +912,8 @@ class BlockSmasher:
         self.draw_glass_rect(back_btn_rect.x, back_btn_rect.y, back_btn_rect.width, back_btn_rect.height,
                            COLOR_CYAN, back_hover)
         
-        create_text = self.font_medium.render("CREATE", True, COLOR_PURPLE)
-        back_text = self.font_medium.render("BACK", True, COLOR_CYAN)
+        create_text = self.render_text(self.font_medium, "CREATE", COLOR_PURPLE)
+        back_text = self.render_text(self.font_medium, "BACK", COLOR_CYAN)
         
         create_text_rect = create_text.get_rect(center=create_btn_rect.center)
         back_text_rect = back_text.get_rect(center=back_btn_rect.center)
@@ -769,50 +942,89 @@ class BlockSmasher:
                 self.username_input = ""
                 self.password_input = ""
             else:
-                if pygame.Rect(input_x, username_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                if username_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "username"
-                elif pygame.Rect(input_x, password_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                elif password_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "password"
         
         if self.error_message:
-            error_surf = self.font_small.render(self.error_message, True, COLOR_ERROR)
+            error_surf = self.render_text(self.font_small, self.error_message, COLOR_ERROR)
             error_rect = error_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 25))
             self.screen.blit(error_surf, error_rect)
         
         if self.success_message:
-            success_surf = self.font_small.render(self.success_message, True, COLOR_SUCCESS)
+            success_surf = self.render_text(self.font_small, self.success_message, COLOR_SUCCESS)
             success_rect = success_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 25))
             self.screen.blit(success_surf, success_rect)
     
-    def draw_main_menu(self):
-        for y in range(SCREEN_HEIGHT):
-            for x in range(0, SCREEN_WIDTH, 3):
-                dist_tl = math.sqrt((x - SCREEN_WIDTH*0.2)**2 + (y - SCREEN_HEIGHT*0.2)**2)
-                dist_br = math.sqrt((x - SCREEN_WIDTH*0.8)**2 + (y - SCREEN_HEIGHT*0.8)**2)
-                
-                glow_tl = max(0, 35 - dist_tl / 12)
-                glow_br = max(0, 35 - dist_br / 12)
-                
-                r = BG_DARK[0] + int(glow_tl * 0.3 + glow_br * 0.15)
-                g = BG_DARK[1] + int(glow_tl * 0.8 + glow_br * 0.4)
-                b = BG_DARK[2] + int(glow_tl * 0.8 + glow_br * 0.1)
-                
-                pygame.draw.line(self.screen, (r, g, b), (x, y), (x+3, y))
+    def build_menu_background(self) -> pygame.Surface:
+        ys, xs = np.mgrid[0:SCREEN_HEIGHT, 0:SCREEN_WIDTH].astype(np.float32)
+        dist_tl = np.hypot(xs - SCREEN_WIDTH*0.2, ys - SCREEN_HEIGHT*0.2)
+        dist_br = np.hypot(xs - SCREEN_WIDTH*0.8, ys - SCREEN_HEIGHT*0.8)
         
-        for block in self.menu_blocks:
-            float_y = math.sin(self.time * 0.5 + block['offset']) * 12
-            size = block['size']
-            x, y = int(block['x']), int(block['y'] + float_y)
-            
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
-            s.fill((*COLOR_PURPLE, 60))
-            self.screen.blit(s, (x, y))
-            pygame.draw.rect(self.screen, COLOR_PURPLE, (x, y, size, size), 2, border_radius=7)
+        glow_tl = np.clip(35 - dist_tl / 12, 0, None)
+        glow_br = np.clip(35 - dist_br / 12, 0, None)
+        
+        r = BG_DARK[0] + (glow_tl * 0.3 + glow_br * 0.15).astype(np.uint8)
+        g = BG_DARK[1] + (glow_tl * 0.8 + glow_br * 0.4).astype(np.uint8)
+        b = BG_DARK[2] + (glow_tl * 0.8 + glow_br * 0.1).astype(np.uint8)
+        
+        pixels = np.stack([r, g, b], axis=-1)
+        return pygame.surfarray.make_surface(pixels.swapaxes(0, 1))
+    
+    def get_menu_block_sprites(self, size: int) -> Tuple[pygame.Surface, List[pygame.Surface]]:
+        sprites = self._menu_block_cache.get(size)
+        if sprites is None:
+            body = pygame.Surface((size, size), pygame.SRCALPHA)
+            body.fill((*COLOR_PURPLE, 60))
+            pygame.draw.rect(body, COLOR_PURPLE, (0, 0, size, size), 2, border_radius=7)
             
+            glows = []
             for i in range(2):
                 glow_size = size + i*5
                 glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
                 pygame.draw.rect(glow_surf, (*COLOR_PURPLE, 18-i*8), (0, 0, glow_size, glow_size), border_radius=9)
+                glows.append(glow_surf)
+            
+            sprites = (body, glows)
+            self._menu_block_cache[size] = sprites
+        return sprites
+    
+    def get_block_sprite(self, color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+        key = (width, height, color)
+        sprite = self._block_sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width + 3, height + 3), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, color, (2, 2, width, height), border_radius=3)
+            pygame.draw.rect(sprite, (*color, 70), (0, 0, width + 3, height + 3), 1, border_radius=4)
+            self._block_sprite_cache[key] = sprite
+        return sprite
+    
+    def get_particle_sprites(self, color: Tuple[int, int, int]) -> List[Optional[pygame.Surface]]:
+        sprites = self._particle_sprites.get(color)
+        if sprites is None:
+            sprites = [None]
+            for size in range(1, MAX_PARTICLE_SIZE + 1):
+                s = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+                pygame.draw.circle(s, color, (size, size), size)
+                sprites.append(s)
+            self._particle_sprites[color] = sprites
+        return sprites
+    
+    def draw_main_menu(self):
+        if self._menu_bg_surface is None:
+            self._menu_bg_surface = self.build_menu_background()
+        self.screen.blit(self._menu_bg_surface, (0, 0))
+        
+        for block in self.menu_blocks:
+            phase = int((self.time * 0.5 + block['offset']) * SIN_TABLE_SCALE) & SIN_TABLE_MASK
+            float_y = SIN_TABLE[phase] * 12
+            size = block['size']
+            x, y = int(block['x']), int(block['y'] + float_y)
+            
+            body, glows = self.get_menu_block_sprites(size)
+            self.screen.blit(body, (x, y))
+            for i, glow_surf in enumerate(glows):
                 self.screen.blit(glow_surf, (x-i*2.5, y-i*2.5))
         
         title_x, title_y = 75, 130
@@ -820,17 +1032,9 @@ class BlockSmasher:
         self.draw_glow_text("SMASHER", self.font_title, COLOR_ORANGE, title_x, title_y + 75)
         
         line_y = title_y + 165
-        for i in range(180):
-            t = i / 180
-            if t < 0.33:
-                color = COLOR_CYAN
-            elif t < 0.66:
-                color = COLOR_PURPLE
-            else:
-                color = COLOR_ORANGE
-            pygame.draw.line(self.screen, color, (title_x + i, line_y), (title_x + i, line_y + 3))
+        self.screen.blit(self._title_bar, (title_x, line_y))
         
-        welcome_text = self.font_small.render(f"Welcome, {self.current_user}!", True, COLOR_FOREGROUND)
+        welcome_text = self.render_text(self.font_small, f"Welcome, {self.current_user}!", COLOR_FOREGROUND)
         self.screen.blit(welcome_text, (title_x, title_y - 40))
         
         button_x, button_y = 75, 360
@@ -857,8 +1061,8 @@ class BlockSmasher:
         
         info_y = button_y + len(buttons) * button_spacing + 15
         self.draw_glass_rect(button_x, info_y, 280, 58, COLOR_CYAN)
-        premium_text = self.font_small.render("PREMIUM EDITION", True, (*COLOR_FOREGROUND, 150))
-        version_text = self.font_tiny.render("Version 1.0.0", True, (*COLOR_FOREGROUND, 100))
+        premium_text = self.render_text(self.font_small, "PREMIUM EDITION", (*COLOR_FOREGROUND, 150))
+        version_text = self.render_text(self.font_tiny, "Version 1.0.0", (*COLOR_FOREGROUND, 100))
         self.screen.blit(premium_text, (button_x + 12, info_y + 10))
         self.screen.blit(version_text, (button_x + 12, info_y + 35))
     
@@ -867,28 +1071,24 @@ class BlockSmasher:
         
         self.draw_glow_text("SELECT MAP", self.font_large, COLOR_CYAN, 40, 25)
         
-        back_rect = pygame.Rect(40, 80, 120, 38)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(40, 80, 120, 38, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("BACK", True, COLOR_CYAN)
+        back_text = self.render_text(self.font_small, "BACK", COLOR_CYAN)
         self.screen.blit(back_text, (65, 89))
         
         if back_hover and self.mouse_clicked:
             self.state = GameState.MAIN_MENU
         
-        curated_rect = pygame.Rect(190, 80, 170, 38)
-        procedural_rect = pygame.Rect(380, 80, 190, 38)
-        
-        curated_hover = curated_rect.collidepoint(self.mouse_x, self.mouse_y)
-        procedural_hover = procedural_rect.collidepoint(self.mouse_x, self.mouse_y)
+        curated_hover = self._curated_tab_rect.collidepoint(self.mouse_x, self.mouse_y)
+        procedural_hover = self._procedural_tab_rect.collidepoint(self.mouse_x, self.mouse_y)
         
         self.draw_glass_rect(190, 80, 170, 38, COLOR_CYAN,
                            curated_hover or self.maps_tab == MapsTab.CURATED)
         self.draw_glass_rect(380, 80, 190, 38, COLOR_PURPLE,
                            procedural_hover or self.maps_tab == MapsTab.PROCEDURAL)
         
-        curated_text = self.font_small.render("CURATED", True, COLOR_CYAN)
-        procedural_text = self.font_small.render("PROCEDURAL", True, COLOR_PURPLE)
+        curated_text = self.render_text(self.font_small, "CURATED", COLOR_CYAN)
+        procedural_text = self.render_text(self.font_small, "PROCEDURAL", COLOR_PURPLE)
         self.screen.blit(curated_text, (220, 89))
         self.screen.blit(procedural_text, (405, 89))
         
@@ -912,65 +1112,50 @@ class BlockSmasher:
             (6, "Explosive Chaos", "Extreme", 80),
         ]
         
-        start_x, start_y = 40, 155
-        card_width, card_height = 310, 115
-        spacing = 20
-        
         for i, (level_id, name, difficulty, blocks) in enumerate(maps):
-            row, col = i // 3, i % 3
-            x = start_x + col * (card_width + spacing)
-            y = start_y + row * (card_height + spacing)
+            x, y, card_rect = self._curated_card_rects[i]
             
             locked = level_id not in self.unlocked_levels
             color = (100, 100, 100) if locked else COLOR_CYAN
             
-            card_rect = pygame.Rect(x, y, card_width, card_height)
             is_hover = card_rect.collidepoint(self.mouse_x, self.mouse_y) and not locked
             
-            self.draw_glass_rect(x, y, card_width, card_height, color, is_hover)
+            self.draw_glass_rect(x, y, card_rect.width, card_rect.height, color, is_hover)
             
-            level_text = self.font_large.render(str(level_id), True, color)
+            level_text = self.render_text(self.font_large, str(level_id), color)
             self.screen.blit(level_text, (x + 15, y + 12))
             
-            name_text = self.font_medium.render(name, True, COLOR_FOREGROUND if not locked else (150, 150, 150))
+            name_text = self.render_text(self.font_medium, name, COLOR_FOREGROUND if not locked else (150, 150, 150))
             self.screen.blit(name_text, (x + 70, y + 16))
             
-            details_text = self.font_small.render(f"{difficulty} | {blocks} blocks", True, COLOR_PURPLE if not locked else (120, 120, 120))
+            details_text = self.render_text(self.font_small, f"{difficulty} | {blocks} blocks", COLOR_PURPLE if not locked else (120, 120, 120))
             self.screen.blit(details_text, (x + 70, y + 55))
             
             if locked:
-                lock_text = self.font_large.render("LOCKED", True, (150, 150, 150))
-                lock_rect = lock_text.get_rect(center=(x + card_width // 2, y + card_height // 2))
+                lock_text = self.render_text(self.font_large, "LOCKED", (150, 150, 150))
+                lock_rect = lock_text.get_rect(center=card_rect.center)
                 self.screen.blit(lock_text, lock_rect)
             
             if is_hover and self.mouse_clicked:
                 self.start_level(level_id)
     
     def draw_procedural_maps(self):
-        start_x, start_y = 40, 155
-        card_width, card_height = 235, 100
-        spacing = 18
-        
         for i in range(12):
             level_id = 101 + i
-            row, col = i // 4, i % 4
-            x = start_x + col * (card_width + spacing)
-            y = start_y + row * (card_height + spacing)
+            x, y, card_rect = self._procedural_card_rects[i]
             
-            card_rect = pygame.Rect(x, y, card_width, card_height)
             is_hover = card_rect.collidepoint(self.mouse_x, self.mouse_y)
             
-            self.draw_glass_rect(x, y, card_width, card_height, COLOR_PURPLE, is_hover)
+            self.draw_glass_rect(x, y, card_rect.width, card_rect.height, COLOR_PURPLE, is_hover)
             
-            num_text = self.font_large.render(str(i + 1), True, COLOR_CYAN)
+            num_text = self.render_text(self.font_large, str(i + 1), COLOR_CYAN)
             self.screen.blit(num_text, (x + 15, y + 12))
             
-            name_text = self.font_small.render(f"Random Level #{i + 1}", True, COLOR_FOREGROUND)
+            name_text = self.render_text(self.font_small, f"Random Level #{i + 1}", COLOR_FOREGROUND)
             self.screen.blit(name_text, (x + 12, y + 52))
             
-            difficulties = ['Easy', 'Medium', 'Hard', 'Expert']
-            difficulty = difficulties[(i // 3) % 4]
-            diff_text = self.font_tiny.render(difficulty, True, COLOR_PURPLE)
+            difficulty = PROCEDURAL_DIFFICULTIES[PROCEDURAL_DIFFICULTY_INDEX[i]]
+            diff_text = self.render_text(self.font_tiny, difficulty, COLOR_PURPLE)
             self.screen.blit(diff_text, (x + 12, y + 75))
             
             if is_hover and self.mouse_clicked:
@@ -982,97 +1167,84 @@ class BlockSmasher:
         canvas_x = (SCREEN_WIDTH - CANVAS_WIDTH) // 2
         canvas_y = (SCREEN_HEIGHT - CANVAS_HEIGHT) // 2 + 20
         
-        for i in range(2):
-            glow_rect = pygame.Rect(canvas_x - 2 - i*2, canvas_y - 2 - i*2, CANVAS_WIDTH + 4 + i*4, CANVAS_HEIGHT + 4 + i*4)
-            pygame.draw.rect(self.screen, (*COLOR_CYAN, 50 - i*20), glow_rect, 2)
-        
-        canvas_surface = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
-        canvas_surface.fill((15, 20, 35))
-        self.screen.blit(canvas_surface, (canvas_x, canvas_y))
+        self.screen.blit(self._canvas_frame, (canvas_x - 4, canvas_y - 4))
         
         for block in self.blocks:
             if block.alive:
                 bx, by = canvas_x + int(block.x), canvas_y + int(block.y)
-                pygame.draw.rect(self.screen, block.color, (bx, by, int(block.width), int(block.height)), border_radius=3)
-                
-                s = pygame.Surface((int(block.width) + 3, int(block.height) + 3), pygame.SRCALPHA)
-                pygame.draw.rect(s, (*block.color, 70), (0, 0, int(block.width) + 3, int(block.height) + 3), 1, border_radius=4)
-                self.screen.blit(s, (bx - 1.5, by - 1.5))
+                sprite = self.get_block_sprite(block.color, int(block.width), int(block.height))
+                self.screen.blit(sprite, (bx - 2, by - 2))
         
         paddle_y = CANVAS_HEIGHT - 35
         px, py = canvas_x + int(self.paddle_x), canvas_y + paddle_y
         pygame.draw.rect(self.screen, COLOR_PURPLE, (px, py, self.paddle_width, self.paddle_height), border_radius=3)
         
-        for i in range(2):
-            s = pygame.Surface((self.paddle_width + i*3, self.paddle_height + i*3), pygame.SRCALPHA)
-            pygame.draw.rect(s, (*COLOR_PURPLE, 45 - i*15), (0, 0, self.paddle_width + i*3, self.paddle_height + i*3), 1, border_radius=5)
+        for i, s in enumerate(self._paddle_glow):
             self.screen.blit(s, (px - i*1.5, py - i*1.5))
         
         ball_pos = (canvas_x + int(self.ball_x), canvas_y + int(self.ball_y))
         pygame.draw.circle(self.screen, COLOR_CYAN, ball_pos, self.ball_radius)
         
-        for i in range(2):
-            s = pygame.Surface((self.ball_radius*2 + i*3, self.ball_radius*2 + i*3), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*COLOR_CYAN, 70 - i*22), (self.ball_radius + i*1.5, self.ball_radius + i*1.5), self.ball_radius + i*1.5, 1)
+        for i, s in enumerate(self._ball_glow):
             self.screen.blit(s, (ball_pos[0] - self.ball_radius - i*1.5, ball_pos[1] - self.ball_radius - i*1.5))
         
         for particle in self.particles:
             if particle.life > 0:
                 alpha = int((particle.life / particle.max_life) * 255)
                 pos = (canvas_x + int(particle.x), canvas_y + int(particle.y))
-                size = max(1, int(particle.size * (particle.life / particle.max_life)))
-                s = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*particle.color, min(255, alpha)), (size, size), size)
-                self.screen.blit(s, (pos[0] - size, pos[1] - size))
+                size = min(MAX_PARTICLE_SIZE, max(1, int(particle.size * (particle.life / particle.max_life))))
+                sprite = self.get_particle_sprites(particle.color)[size]
+                sprite.set_alpha(min(255, alpha))
+                self.screen.blit(sprite, (pos[0] - size, pos[1] - size))
         
-        level_text = f"Random Level #{self.current_level - 99}" if self.current_level >= 100 else f"Level {self.current_level}"
-        hud = self.font_small.render(f"{level_text} | Score: {self.score} | Lives: {self.lives}", True, COLOR_FOREGROUND)
-        self.screen.blit(hud, (40, 20))
+        hud_key = (self._level_text, self.score, self.lives)
+        if hud_key != self._hud_key:
+            self._hud_cache = self.font_small.render("%s | Score: %d | Lives: %d" % hud_key, True, COLOR_FOREGROUND)
+            self._hud_key = hud_key
+        self.screen.blit(self._hud_cache, (40, 20))
         
         if self.settings.show_fps:
-            fps_text = self.font_small.render(f"FPS: {self.fps_counter}", True, COLOR_ORANGE)
-            self.screen.blit(fps_text, (SCREEN_WIDTH - 100, 20))
+            if self.fps_counter != self._fps_key:
+                self._fps_cache = self.font_small.render(f"FPS: {self.fps_counter}", True, COLOR_ORANGE)
+                self._fps_key = self.fps_counter
+            self.screen.blit(self._fps_cache, (SCREEN_WIDTH - 100, 20))
         
         if not self.ball_launched:
-            hint = self.font_small.render("SPACE or CLICK to launch", True, COLOR_CYAN)
+            hint = self.render_text(self.font_small, "SPACE or CLICK to launch", COLOR_CYAN)
             hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 35))
             self.screen.blit(hint, hint_rect)
         
         if self.game_over_type:
             self.draw_game_over_overlay()
         
-        pause_rect = pygame.Rect(40, 60, 55, 38)
-        pause_hover = pause_rect.collidepoint(self.mouse_x, self.mouse_y)
+        pause_hover = self._pause_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(40, 60, 55, 38, COLOR_ORANGE, pause_hover)
-        pause_text = self.font_medium.render("||", True, COLOR_ORANGE)
+        pause_text = self.render_text(self.font_medium, "||", COLOR_ORANGE)
         self.screen.blit(pause_text, (50, 65))
         
         if pause_hover and self.mouse_clicked:
             self.state = GameState.MAPS_SCREEN
     
     def draw_game_over_overlay(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
         
         if self.game_over_type == 'victory':
             self.draw_glow_text("VICTORY!", self.font_title, COLOR_CYAN, SCREEN_WIDTH // 2, 200, center=True)
-            stars = self.font_large.render("COMPLETE", True, COLOR_YELLOW)
+            stars = self.render_text(self.font_large, "COMPLETE", COLOR_YELLOW)
             stars_rect = stars.get_rect(center=(SCREEN_WIDTH // 2, 280))
             self.screen.blit(stars, stars_rect)
         else:
             self.draw_glow_text("GAME OVER", self.font_title, COLOR_ORANGE, SCREEN_WIDTH // 2, 200, center=True)
         
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_FOREGROUND)
+        score_text = self.render_text(self.font_medium, f"Final Score: {self.score}", COLOR_FOREGROUND)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 350))
         self.screen.blit(score_text, score_rect)
         
-        saved_text = self.font_small.render("Score saved to leaderboard", True, COLOR_SUCCESS)
+        saved_text = self.render_text(self.font_small, "Score saved to leaderboard", COLOR_SUCCESS)
         saved_rect = saved_text.get_rect(center=(SCREEN_WIDTH // 2, 390))
         self.screen.blit(saved_text, saved_rect)
         
-        retry_rect = pygame.Rect(SCREEN_WIDTH // 2 - 190, 440, 175, 55)
-        menu_rect = pygame.Rect(SCREEN_WIDTH // 2 + 15, 440, 175, 55)
+        retry_rect, menu_rect = self._overlay_button_rects
         
         retry_hover = retry_rect.collidepoint(self.mouse_x, self.mouse_y)
         menu_hover = menu_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -1080,8 +1252,8 @@ class BlockSmasher:
         self.draw_glass_rect(retry_rect.x, retry_rect.y, retry_rect.width, retry_rect.height, COLOR_PURPLE, retry_hover)
         self.draw_glass_rect(menu_rect.x, menu_rect.y, menu_rect.width, menu_rect.height, COLOR_CYAN, menu_hover)
         
-        retry_text = self.font_medium.render("RETRY", True, COLOR_PURPLE)
-        menu_text = self.font_medium.render("MENU", True, COLOR_CYAN)
+        retry_text = self.render_text(self.font_medium, "RETRY", COLOR_PURPLE)
+        menu_text = self.render_text(self.font_medium, "MENU", COLOR_CYAN)
         retry_text_rect = retry_text.get_rect(center=retry_rect.center)
         menu_text_rect = menu_text.get_rect(center=menu_rect.center)
         self.screen.blit(retry_text, retry_text_rect)
@@ -1097,18 +1269,14 @@ class BlockSmasher:
         
         self.draw_glow_text("SETTINGS", self.font_large, COLOR_CYAN, 40, 25)
         
-        back_rect = pygame.Rect(40, 80, 120, 38)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(40, 80, 120, 38, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("BACK", True, COLOR_CYAN)
+        back_text = self.render_text(self.font_small, "BACK", COLOR_CYAN)
         self.screen.blit(back_text, (65, 89))
         
         if back_hover and self.mouse_clicked:
             self.state = GameState.MAIN_MENU
         
-        y = 170
-        spacing = 70
-        
         settings_items = [
             f"Particle Effects: {'ON' if self.settings.particle_effects else 'OFF'}",
             f"Screen Shake: {'ON' if self.settings.screen_shake else 'OFF'}",
@@ -1118,13 +1286,12 @@ class BlockSmasher:
         ]
         
         for i, item in enumerate(settings_items):
-            item_y = y + i * spacing
-            item_rect = pygame.Rect(SCREEN_WIDTH // 2 - 230, item_y, 460, 56)
+            item_rect = self._settings_item_rects[i]
             item_hover = item_rect.collidepoint(self.mouse_x, self.mouse_y)
             
             self.draw_glass_rect(item_rect.x, item_rect.y, item_rect.width, item_rect.height, COLOR_PURPLE, item_hover)
             
-            item_text = self.font_medium.render(item, True, COLOR_FOREGROUND)
+            item_text = self.render_text(self.font_medium, item, COLOR_FOREGROUND)
             item_text_rect = item_text.get_rect(center=item_rect.center)
             self.screen.blit(item_text, item_text_rect)
             
@@ -1138,67 +1305,85 @@ class BlockSmasher:
         
         self.draw_glow_text("LEADERBOARD", self.font_large, COLOR_CYAN, 40, 25)
         
-        back_rect = pygame.Rect(40, 80, 120, 38)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(40, 80, 120, 38, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("BACK", True, COLOR_CYAN)
+        back_text = self.render_text(self.font_small, "BACK", COLOR_CYAN)
         self.screen.blit(back_text, (65, 89))
         
         if back_hover and self.mouse_clicked:
             self.state = GameState.MAIN_MENU
         
-        top_scores = self.data_manager.get_top_scores(10)
+        top_scores = self.get_top_scores()
         
         if not top_scores:
-            no_scores_text = self.font_medium.render("No scores yet. Play to compete!", True, COLOR_FOREGROUND)
+            no_scores_text = self.render_text(self.font_medium, "No scores yet. Play to compete!", COLOR_FOREGROUND)
             no_scores_rect = no_scores_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(no_scores_text, no_scores_rect)
             return
         
-        if len(top_scores) > 0:
-            podium_y = 180
-            self.draw_glass_rect(SCREEN_WIDTH // 2 - 120, podium_y, 240, 135, COLOR_YELLOW, True)
-            
-            first_text = self.font_title.render("1", True, COLOR_YELLOW)
-            first_rect = first_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 38))
-            self.screen.blit(first_text, first_rect)
-            
-            name_text = self.font_medium.render(top_scores[0].username, True, COLOR_FOREGROUND)
-            name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 85))
-            self.screen.blit(name_text, name_rect)
-            
-            score_text = self.font_small.render(f"{top_scores[0].score:,} pts | Level {top_scores[0].level}", True, COLOR_CYAN)
-            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 110))
-            self.screen.blit(score_text, score_rect)
+        podium_key = (top_scores[0].username, top_scores[0].score, top_scores[0].level)
+        if podium_key != self._podium_key:
+            self._podium_surface = self.build_podium_panel(top_scores[0])
+            self._podium_key = podium_key
+        self.screen.blit(self._podium_surface, (SCREEN_WIDTH // 2 - 122, 178),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
         
         list_y = 350
+        row_cache = {}
         for i, entry in enumerate(top_scores[1:], start=1):
             if i >= 10:
                 break
             
-            entry_y = list_y + (i - 1) * 50
-            self.draw_glass_rect(SCREEN_WIDTH // 2 - 265, entry_y, 530, 44, COLOR_PURPLE)
-            
-            rank_text = self.font_medium.render(f"#{i + 1}", True, COLOR_CYAN)
-            self.screen.blit(rank_text, (SCREEN_WIDTH // 2 - 245, entry_y + 10))
+            key = (entry.username, entry.score, entry.level, i)
+            row = self._leaderboard_row_cache.get(key)
+            if row is None:
+                row = self.build_leaderboard_row(entry, i)
+            row_cache[key] = row
             
-            name_text = self.font_medium.render(entry.username, True, COLOR_FOREGROUND)
-            self.screen.blit(name_text, (SCREEN_WIDTH // 2 - 175, entry_y + 10))
-            
-            score_text = self.font_medium.render(f"{entry.score:,} pts", True, COLOR_ORANGE)
-            score_rect = score_text.get_rect(right=SCREEN_WIDTH // 2 + 250, centery=entry_y + 22)
-            self.screen.blit(score_text, score_rect)
-            
-            level_text = self.font_small.render(f"Lvl {entry.level}", True, (*COLOR_FOREGROUND, 150))
-            level_rect = level_text.get_rect(right=SCREEN_WIDTH // 2 + 160, centery=entry_y + 22)
-            self.screen.blit(level_text, level_rect)
+            entry_y = list_y + (i - 1) * 50
+            self.screen.blit(row, (SCREEN_WIDTH // 2 - 267, entry_y - 2),
+                             special_flags=pygame.BLEND_PREMULTIPLIED)
+        self._leaderboard_row_cache = row_cache
+    
+    def compose_glass_panel(self, width: int, height: int, border_color: Tuple[int, int, int], glow: bool,
+                            items: List[Tuple[pygame.Surface, pygame.Rect]]) -> pygame.Surface:
+        panel = self.get_glass_surface(width, height, border_color, glow, 10).copy()
+        for surf, rect in items:
+            # Font surfaces can have padded rows, which premul_alpha() does not
+            # handle; copying first gives a tightly packed surface.
+            panel.blit(surf.copy().premul_alpha(), rect.move(2, 2), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return panel
+    
+    def build_podium_panel(self, entry: LeaderboardEntry) -> pygame.Surface:
+        first_text = self.font_title.render("1", True, COLOR_YELLOW)
+        name_text = self.font_medium.render(entry.username, True, COLOR_FOREGROUND)
+        score_text = self.font_small.render(f"{entry.score:,} pts | Level {entry.level}", True, COLOR_CYAN)
+        return self.compose_glass_panel(240, 135, COLOR_YELLOW, True, [
+            (first_text, first_text.get_rect(center=(120, 38))),
+            (name_text, name_text.get_rect(center=(120, 85))),
+            (score_text, score_text.get_rect(center=(120, 110))),
+        ])
+    
+    def build_leaderboard_row(self, entry: LeaderboardEntry, index: int) -> pygame.Surface:
+        rank_text = self.font_medium.render(f"#{index + 1}", True, COLOR_CYAN)
+        name_text = self.font_medium.render(entry.username, True, COLOR_FOREGROUND)
+        score_text = self.font_medium.render(f"{entry.score:,} pts", True, COLOR_ORANGE)
+        level_text = self.font_small.render(f"Lvl {entry.level}", True, (*COLOR_FOREGROUND, 150))
+        return self.compose_glass_panel(530, 44, COLOR_PURPLE, False, [
+            (rank_text, rank_text.get_rect(topleft=(20, 10))),
+            (name_text, name_text.get_rect(topleft=(90, 10))),
+            (score_text, score_text.get_rect(right=515, centery=22)),
+            (level_text, level_text.get_rect(right=425, centery=22)),
+        ])
     
     def handle_text_input(self, event):
         if event.key == pygame.K_BACKSPACE:
-            if self.input_active == "username":
-                self.username_input = self.username_input[:-1]
-            elif self.input_active == "password":
-                self.password_input = self.password_input[:-1]
+            if self.input_active == "username" and self._username_buf:
+                self._username_buf.pop()
+                self._username_text = None
+            elif self.input_active == "password" and self._password_buf:
+                self._password_buf.pop()
+                self._password_text = None
         elif event.key == pygame.K_TAB:
             self.input_active = "password" if self.input_active == "username" else "username"
         elif event.key == pygame.K_RETURN:
@@ -1226,15 +1411,19 @@ class BlockSmasher:
                     self.success_message = ""
         else:
             if event.unicode.isprintable() and len(event.unicode) == 1:
-                if self.input_active == "username" and len(self.username_input) < 20:
-                    self.username_input += event.unicode
-                elif self.input_active == "password" and len(self.password_input) < 30:
-                    self.password_input += event.unicode
+                if self.input_active == "username" and len(self._username_buf) < 20:
+                    self._username_buf.append(event.unicode)
+                    self._username_text = None
+                elif self.input_active == "password" and len(self._password_buf) < 30:
+                    self._password_buf.append(event.unicode)
+                    self._password_text = None
     
     def handle_events(self):
         self.mouse_clicked = False
         
         for event in pygame.event.get():
+            self._dirty = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -1272,25 +1461,35 @@ class BlockSmasher:
             self.time += 0.016
             self.handle_events()
             
-            self.screen.fill(BG_DARK)
-            
-            if self.state == GameState.LOGIN:
-                self.draw_login_screen()
-            elif self.state == GameState.REGISTER:
-                self.draw_register_screen()
-            elif self.state == GameState.MAIN_MENU:
-                self.draw_main_menu()
-            elif self.state == GameState.MAPS_SCREEN:
-                self.draw_maps_screen()
-            elif self.state == GameState.GAME_SCREEN:
-                self.update_game()
-                self.draw_game_screen()
-            elif self.state == GameState.SETTINGS_SCREEN:
-                self.draw_settings_screen()
-            elif self.state == GameState.LEADERBOARD_SCREEN:
-                self.draw_leaderboard_screen()
-            
-            pygame.display.flip()
+            # Static screens only change in response to input, so an idle
+            # frame keeps the previously presented image.
+            if self._dirty or self.state not in STATIC_STATES or self.state != self._drawn_state:
+                self._dirty = False
+                self._drawn_state = self.state
+                
+                self.screen.fill(BG_DARK)
+                
+                if self.state == GameState.LOGIN:
+                    self.draw_login_screen()
+                elif self.state == GameState.REGISTER:
+                    self.draw_register_screen()
+                elif self.state == GameState.MAIN_MENU:
+                    self.draw_main_menu()
+                elif self.state == GameState.MAPS_SCREEN:
+                    self.draw_maps_screen()
+                elif self.state == GameState.GAME_SCREEN:
+                    self.update_game()
+                    self.draw_game_screen()
+                elif self.state == GameState.SETTINGS_SCREEN:
+                    self.draw_settings_screen()
+                elif self.state == GameState.LEADERBOARD_SCREEN:
+                    self.draw_leaderboard_screen()
+                
+                pygame.display.flip()
+                
+                # Click handlers run inside the draw methods, after their screen was
+                # painted, so a click keeps the next frame dirty to show its result
+                self._dirty = self.mouse_clicked
             
             self.clock.tick(FPS)
             self.fps_counter = int(self.clock.get_fps())
@@ -4,14 +4,20 @@ Complete with Login System, Real Leaderboard, 1366x768 Resolution
 """
 
 import pygame
+import numpy as np
 import random
 import math
 import sys
+import time
 import json
 import os
 import hashlib
+import hmac
+import bisect
+from functools import lru_cache, partial
 from dataclasses import dataclass, asdict
-from typing import List, Tuple, Optional, Dict
+from collections import namedtuple, OrderedDict
+from typing import List, Tuple, Optional, Dict, Callable
 from enum import Enum
 from datetime import datetime
 
@@ -25,6 +31,51 @@ CANVAS_WIDTH = 800
 CANVAS_HEIGHT = 600
 FPS = 60
 
+# Set BLOCK_SMASHER_DEBUG to shut down through pygame.quit() and SystemExit instead of os._exit()
+DEBUG = bool(os.environ.get("BLOCK_SMASHER_DEBUG"))
+
+# Simulation advances in fixed steps of FIXED_DT seconds; velocities are in pixels per step.
+# A long stall is clamped to MAX_FRAME_DT so the catch-up loop cannot spiral.
+FIXED_DT = 1 / FPS
+MAX_FRAME_DT = 0.25
+
+# The frame pacer sleeps until this close to the deadline, then spins for sub-millisecond accuracy
+SPIN_MARGIN = 0.0015
+
+# Vsynced frames averaging shorter than this mean the driver ignores vsync, so software pacing takes over
+MIN_VSYNC_FRAME = 1 / 250
+
+# Longest an idle static screen blocks waiting for input before the loop runs again
+IDLE_WAIT_MS = 100
+
+# The only event types handle_events reacts to; SDL drops everything else before it is queued
+HANDLED_EVENTS = (pygame.QUIT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN,
+                  pygame.TEXTINPUT, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+PADDLE_SPEED = 10
+LAUNCH_VECTORS = 256
+PARTICLE_CAPACITY = 4096
+BLOCK_GRID_CELL = 100
+LEADERBOARD_PANEL_Y = 200
+CARD_GRID_ORIGIN = (50, 190)
+
+# Map card grids as (columns, card width, card height, spacing)
+CURATED_CARD_LAYOUT = (3, 400, 135, 25)
+PROCEDURAL_CARD_LAYOUT = (4, 295, 120, 22)
+PASSWORD_MAX_LENGTH = 30
+
+# Password field masks, one shared string per length
+PASSWORD_MASKS = tuple("*" * i for i in range(PASSWORD_MAX_LENGTH + 1))
+
+# Curated maps as (level_id, name, difficulty, block count)
+CURATED_MAPS = (
+    (1, "First Steps", "Easy", 24),
+    (2, "Circular Formation", "Medium", 8),
+    (3, "Pyramid Power", "Medium", 36),
+    (4, "Checkerboard", "Hard", 32),
+    (5, "The Fortress", "Hard", 64),
+    (6, "Explosive Chaos", "Extreme", 80),
+)
+
 # Exact Color Palette
 BG_DARK = (10, 14, 26)
 BG_CARD = (18, 23, 40)
@@ -42,6 +93,55 @@ COLOR_SUCCESS = (34, 197, 94)
 GLASS_BG = (20, 25, 40, 100)
 GLASS_BORDER = (64, 224, 208, 40)
 
+# Translucent text colors used every frame
+COLOR_FOREGROUND_A100 = (*COLOR_FOREGROUND, 100)
+COLOR_FOREGROUND_A150 = (*COLOR_FOREGROUND, 150)
+
+@lru_cache(maxsize=256)
+def rgba(color: Tuple[int, ...], alpha: int) -> Tuple[int, int, int, int]:
+    """Cached RGBA color tuple"""
+    return (*color[:3], alpha)
+
+@lru_cache(maxsize=2048)
+def format_points(score: int) -> str:
+    """Score with thousands separators, e.g. '12,300 pts'"""
+    return f"{score:,} pts"
+
+# Trig tables for the procedural cluster patterns whose angles don't depend on the RNG
+LINE_WAVE = tuple(math.sin(i * 0.9) * 12 for i in range(16))
+
+@lru_cache(maxsize=None)
+def spiral_offsets(count: int) -> Tuple[Tuple[float, float], ...]:
+    """Spiral offsets for n blocks"""
+    # (cos, sin) pairs and radius factors on the unit circle
+    return tuple((math.cos((i / count) * math.pi * 2 * 1.5), math.sin((i / count) * math.pi * 2 * 1.5), i / count)
+                 for i in range(count))
+
+@lru_cache(maxsize=None)
+def glow_table(peak: float, falloff: float) -> np.ndarray:
+    """Glow intensity by squared distance"""
+    # max(0, peak - sqrt(d2)/falloff) for every integer d2 inside the glow, then one 0
+    reach = int(peak * falloff)
+    return np.clip(peak - np.sqrt(np.arange(reach * reach + 1)) / falloff, 0, None)
+
+def radial_glow(cx: int, cy: int, peak: float, falloff: float) -> np.ndarray:
+    """Screen-sized glow around a pixel"""
+    # [x, y] array of max(0, peak - dist/falloff) around (cx, cy), looked up in glow_table
+    table = glow_table(peak, falloff)
+    reach = int(peak * falloff)
+    glow = np.zeros((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    # Anything with d2 >= reach**2 is dark, so only the glow's bounding box is looked up
+    x0, x1 = max(cx - reach, 0), min(cx + reach + 1, SCREEN_WIDTH)
+    y0, y1 = max(cy - reach, 0), min(cy + reach + 1, SCREEN_HEIGHT)
+    if x0 < x1 and y0 < y1:
+        dx = np.arange(x0, x1, dtype=np.int32)[:, None] - cx
+        dy = np.arange(y0, y1, dtype=np.int32)[None, :] - cy
+        d2 = dx * dx + dy * dy
+        np.minimum(d2, len(table) - 1, out=d2)
+        glow[x0:x1, y0:y1] = table.take(d2)
+    return glow
+
 # Game States
 class GameState(Enum):
     LOGIN = 0
@@ -52,12 +152,20 @@ class GameState(Enum):
     SETTINGS_SCREEN = 5
     LEADERBOARD_SCREEN = 6
 
+# Screens without animation; they are only redrawn when their inputs change
+STATIC_SCREENS = frozenset({GameState.LOGIN, GameState.REGISTER, GameState.MAPS_SCREEN,
+                            GameState.SETTINGS_SCREEN, GameState.LEADERBOARD_SCREEN})
+
+# Screens with text fields; SDL text input (and IME composition) is on only while one is up
+AUTH_SCREENS = frozenset({GameState.LOGIN, GameState.REGISTER})
+
 class MapsTab(Enum):
     CURATED = 1
     PROCEDURAL = 2
 
 @dataclass
 class Block:
+    __slots__ = ('x', 'y', 'width', 'height', 'alive', 'color')
     x: float
     y: float
     width: float
@@ -65,16 +173,7 @@ class Block:
     alive: bool
     color: Tuple[int, int, int]
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float
-    max_life: float
-    size: float
-    color: Tuple[int, int, int]
+FloatingBlock = namedtuple('FloatingBlock', 'x y size offset')
 
 @dataclass
 class Settings:
@@ -89,6 +188,7 @@ class Settings:
 
 @dataclass
 class LeaderboardEntry:
+    __slots__ = ('username', 'score', 'level', 'timestamp')
     username: str
     score: int
     level: int
@@ -105,6 +205,73 @@ class User:
         if self.levels_completed is None:
             self.levels_completed = []
 
+class ParticleSystem:
+    """Struct-of-arrays particle storage stepped with NumPy"""
+    
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), np.uint8)
+    
+    def __len__(self):
+        return self.count
+    
+    def clear(self):
+        """Drop all live particles"""
+        self.count = 0
+    
+    def emit(self, x: float, y: float, count: int, color: Tuple[int, int, int]):
+        """Spawn a burst of particles at (x, y)"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(2, 5, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        self.life[start:end] = 1.0
+        self.size[start:end] = np.random.uniform(2, 4, count)
+        self.color[start:end] = color
+        self.count = end
+    
+    def update(self, gravity: float = 0.3, decay: float = 0.015):
+        """Advance particles one tick"""
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += gravity
+        self.life[:n] -= decay
+        
+        # Every particle spawns at life 1.0 and decays at the same rate, so
+        # life ascends with index and the dead ones form a prefix.
+        dead = int(np.searchsorted(self.life[:n], 0.0, side='right'))
+        if dead:
+            k = n - dead
+            for column in (self.x, self.y, self.vx, self.vy, self.life, self.size, self.color):
+                column[:k] = column[dead:n]
+            self.count = k
+    
+    def visible(self):
+        """Yield live particles for drawing"""
+        # (x, y, radius, alpha, color), with alpha faded in one vectorized pass
+        n = self.count
+        life = self.life[:n]
+        alpha = np.minimum((life * 255).astype(int), 255)
+        radius = np.maximum((self.size[:n] * life).astype(int), 1)
+        return zip(self.x[:n].astype(int).tolist(), self.y[:n].astype(int).tolist(), radius.tolist(),
+                   alpha.tolist(), map(tuple, self.color[:n].tolist()))
+
 class DataManager:
     """Manages user data and leaderboard persistence"""
     
@@ -113,20 +280,39 @@ class DataManager:
         self.leaderboard_file = 'leaderboard.json'
         self.users: Dict[str, User] = {}
         self.leaderboard: List[LeaderboardEntry] = []
+        self._neg_scores: List[int] = []  # -score per leaderboard entry, ascending
+        self._users_dirty = False
+        self._lb_dirty = False
+        self.leaderboard_version = 0  # bumped whenever the ranking changes
         self.load_data()
     
-    def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def hash_password(self, password: str, salt: str = "") -> str:
+        """Hash a password"""
+        # 'scrypt$<salt>$<digest>'; without a salt, the legacy bare SHA-256 digest
+        if not salt:
+            return hashlib.sha256(password.encode()).hexdigest()
+        digest = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=2**14, r=8, p=1, dklen=32).hex()
+        return f"scrypt${salt}${digest}"
+    
+    def check_password(self, user: User, password: str) -> bool:
+        """Verify a password"""
+        stored = user.password_hash
+        salt = stored.split("$")[1] if stored.startswith("scrypt$") else ""
+        return hmac.compare_digest(stored, self.hash_password(password, salt))
     
     def load_data(self):
         """Load users and leaderboard from JSON files"""
         # Load users
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r') as f:
-                    users_data = json.load(f)
+                with open(self.users_file, 'rb') as f:
+                    users_data = json.loads(f.read())
                     for username, user_data in users_data.items():
+                        # Fold a separately stored salt into the hash string so the file keeps the shared schema
+                        salt = user_data.pop('salt', "")
+                        if salt and not user_data['password_hash'].startswith("scrypt$"):
+                            user_data['password_hash'] = f"scrypt${salt}${user_data['password_hash']}"
+                            self._users_dirty = True
                         self.users[username] = User(**user_data)
             except Exception as e:
                 print(f"Error loading users: {e}")
@@ -134,31 +320,54 @@ class DataManager:
         # Load leaderboard
         if os.path.exists(self.leaderboard_file):
             try:
-                with open(self.leaderboard_file, 'r') as f:
-                    leaderboard_data = json.load(f)
+                with open(self.leaderboard_file, 'rb') as f:
+                    leaderboard_data = json.loads(f.read())
                     self.leaderboard = [LeaderboardEntry(**entry) for entry in leaderboard_data]
                     # Sort by score descending
                     self.leaderboard.sort(key=lambda x: x.score, reverse=True)
+                    self._neg_scores = [-entry.score for entry in self.leaderboard]
             except Exception as e:
                 print(f"Error loading leaderboard: {e}")
     
-    def save_data(self):
-        """Save users and leaderboard to JSON files"""
-        # Save users
+    def write_json(self, path: str, data):
+        """Atomically write compact JSON"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(data, separators=(',', ':')))
+        os.replace(tmp_path, path)
+    
+    def save_users(self) -> bool:
+        """Save users to JSON file"""
         try:
             users_data = {username: asdict(user) for username, user in self.users.items()}
-            with open(self.users_file, 'w') as f:
-                json.dump(users_data, f, indent=2)
+            self.write_json(self.users_file, users_data)
+            return True
         except Exception as e:
             print(f"Error saving users: {e}")
-        
-        # Save leaderboard
+            return False
+    
+    def save_leaderboard(self) -> bool:
+        """Save leaderboard to JSON file"""
         try:
             leaderboard_data = [asdict(entry) for entry in self.leaderboard]
-            with open(self.leaderboard_file, 'w') as f:
-                json.dump(leaderboard_data, f, indent=2)
+            self.write_json(self.leaderboard_file, leaderboard_data)
+            return True
         except Exception as e:
             print(f"Error saving leaderboard: {e}")
+            return False
+    
+    def save_data(self):
+        """Save users and leaderboard to JSON files"""
+        self.save_users()
+        self.save_leaderboard()
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        # A failed write stays pending and is retried on the next flush
+        if self._users_dirty and self.save_users():
+            self._users_dirty = False
+        if self._lb_dirty and self.save_leaderboard():
+            self._lb_dirty = False
     
     def register_user(self, username: str, password: str) -> Tuple[bool, str]:
         """Register a new user"""
@@ -171,9 +380,10 @@ class DataManager:
         if username in self.users:
             return False, "Username already exists"
         
-        password_hash = self.hash_password(password)
+        salt = os.urandom(16).hex()
+        password_hash = self.hash_password(password, salt)
         self.users[username] = User(username=username, password_hash=password_hash)
-        self.save_data()
+        self._users_dirty = True
         return True, "Registration successful!"
     
     def login_user(self, username: str, password: str) -> Tuple[bool, str]:
@@ -181,10 +391,15 @@ class DataManager:
         if username not in self.users:
             return False, "Username not found"
         
-        password_hash = self.hash_password(password)
-        if self.users[username].password_hash != password_hash:
+        user = self.users[username]
+        if not self.check_password(user, password):
             return False, "Incorrect password"
         
+        # Upgrade legacy SHA-256 accounts now that the plain password is known
+        if not user.password_hash.startswith("scrypt$"):
+            user.password_hash = self.hash_password(password, os.urandom(16).hex())
+            self._users_dirty = True
+        
         return True, "Login successful!"
     
     def add_score(self, username: str, score: int, level: int):
@@ -195,28 +410,54 @@ class DataManager:
             level=level,
             timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
         )
-        self.leaderboard.append(entry)
-        self.leaderboard.sort(key=lambda x: x.score, reverse=True)
+        index = bisect.bisect_right(self._neg_scores, -score)
+        self._neg_scores.insert(index, -score)
+        self.leaderboard.insert(index, entry)
         
         # Keep top 100
-        self.leaderboard = self.leaderboard[:100]
+        del self._neg_scores[100:]
+        del self.leaderboard[100:]
         
         # Update user high score
         if username in self.users:
             if score > self.users[username].high_score:
                 self.users[username].high_score = score
+                self._users_dirty = True
         
-        self.save_data()
+        # Written out by the main loop via flush()
+        self._lb_dirty = True
+        self.leaderboard_version += 1
     
     def get_top_scores(self, limit: int = 10) -> List[LeaderboardEntry]:
         """Get top N scores"""
         return self.leaderboard[:limit]
 
 class BlockSmasher:
+    """Main game application"""
+    
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Prefer the GPU-scaled, vsynced renderer and fall back when the driver lacks one;
+        # the plain mode is the last resort, so its error propagates
+        for vsync in (1, 0):
+            try:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                      pygame.SCALED | pygame.DOUBLEBUF, vsync=vsync)
+                break
+            except pygame.error:
+                continue
+        else:
+            vsync = 0
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._vsync = bool(vsync)  # flip() then waits for vblank and replaces the software pacer
         pygame.display.set_caption("BLOCK SMASHER - Futuristic Neon Edition")
-        self.clock = pygame.time.Clock()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        pygame.key.stop_text_input()
+        self._text_input_on = False
+        self._next_frame = time.perf_counter()
+        self._last_frame = self._next_frame
+        self._frame_time_ema = FIXED_DT
+        self._last_fps_sample = self._next_frame
         self.running = True
         
         # Load Fonts
@@ -247,7 +488,13 @@ class BlockSmasher:
         self.score = 0
         self.lives = 3
         self.paddle_x = CANVAS_WIDTH // 2 - 60
+        self._paddle_mouse_x = None
         self.paddle_width = 120
+        
+        # Ring of launch x-velocities drawn once from a private RNG
+        launch_rng = random.Random()
+        self._launch_vx = tuple(launch_rng.uniform(-3, 3) for _ in range(LAUNCH_VECTORS))
+        self._launch_idx = 0
         self.paddle_height = 15
         self.ball_x = CANVAS_WIDTH // 2
         self.ball_y = CANVAS_HEIGHT - 100
@@ -256,26 +503,301 @@ class BlockSmasher:
         self.ball_radius = 8
         self.ball_launched = False
         self.blocks: List[Block] = []
-        self.particles: List[Particle] = []
+        self.blocks_remaining = 0
+        self.block_grid: Dict[Tuple[int, int], List[tuple]] = {}
+        self._block_cells: List[List[Tuple[int, int]]] = []
+        self.particles = ParticleSystem()
         self.unlocked_levels = [1]
+        self._level_layouts: Dict[int, List[tuple]] = {}
         
         # Animation Variables
         self.time = 0
+        self._accum = 0.0
+        self._pending_state: Optional[Tuple[GameState, GameState, float]] = None  # (from, to, due)
         self.menu_blocks = self.create_floating_blocks()
+        self._menu_block_y = np.array([block.y for block in self.menu_blocks])
+        self._menu_block_phases = np.array([block.offset for block in self.menu_blocks], dtype=float)
         self.game_over_type = None
         self.fps_counter = 0
         
         # Mouse State
         self.mouse_x, self.mouse_y = pygame.mouse.get_pos()
         self.mouse_clicked = False
+        self._last_flush = 0
+        
+        # Static hit regions
+        self._login_rects = self.layout_auth_card(400, 280)
+        self._register_rects = self.layout_auth_card(450, 300)
+        self._back_rect = pygame.Rect(50, 100, 140, 45)
+        self._curated_tab_rect = pygame.Rect(240, 100, 200, 45)
+        self._procedural_tab_rect = pygame.Rect(460, 100, 220, 45)
+        self._curated_card_rects = self.layout_cards(len(CURATED_MAPS), *CURATED_CARD_LAYOUT)
+        self._curated_panel_rect = self._curated_card_rects[0][2].unionall(
+            [rect for _, _, rect in self._curated_card_rects]).inflate(12, 12)
+        self._procedural_card_rects = self.layout_cards(12, *PROCEDURAL_CARD_LAYOUT)
+        self._pause_rect = pygame.Rect(50, 75, 65, 45)
+        self._overlay_button_rects = (pygame.Rect(SCREEN_WIDTH // 2 - 230, 520, 210, 65),
+                                      pygame.Rect(SCREEN_WIDTH // 2 + 20, 520, 210, 65))
+        self._settings_item_rects = [pygame.Rect(SCREEN_WIDTH // 2 - 280, 210 + i * 80, 560, 65) for i in range(5)]
+        self._menu_buttons = [
+            ("▶", "PLAY", GameState.MAPS_SCREEN),
+            ("◆", "MAPS", GameState.MAPS_SCREEN),
+            ("★", "LEADERBOARD", GameState.LEADERBOARD_SCREEN),
+            ("⚙", "SETTINGS", GameState.SETTINGS_SCREEN),
+            ("⎋", "LOGOUT", GameState.LOGIN),
+        ]
+        self._menu_button_rects = [pygame.Rect(100, 420 + i * 65, 340, 50) for i in range(len(self._menu_buttons))]
+        
+        # Draw method per screen
+        self._draw_dispatch = {
+            GameState.LOGIN: self.draw_login_screen,
+            GameState.REGISTER: self.draw_register_screen,
+            GameState.MAIN_MENU: self.draw_main_menu,
+            GameState.MAPS_SCREEN: self.draw_maps_screen,
+            GameState.GAME_SCREEN: self.draw_game_screen,
+            GameState.SETTINGS_SCREEN: self.draw_settings_screen,
+            GameState.LEADERBOARD_SCREEN: self.draw_leaderboard_screen,
+        }
+        
+        # KEYDOWN handler per screen, so each key only runs the branches its screen uses
+        self._key_handlers = {state: self.handle_menu_key for state in GameState}
+        self._key_handlers.update({GameState.LOGIN: self.handle_text_input,
+                                   GameState.REGISTER: self.handle_text_input,
+                                   GameState.GAME_SCREEN: self.handle_game_key})
+        
+        # Click handlers per screen as ((x, y, w, h), callback), first hit wins
+        self._hit_zones = self.build_hit_zones()
+        
+        # Rects whose hover state changes how a static screen looks
+        back_and_tabs = [self._back_rect, self._curated_tab_rect, self._procedural_tab_rect]
+        self._hover_rects = {
+            GameState.LOGIN: [tuple(rect) for rect in self._login_rects[2:]],
+            GameState.REGISTER: [tuple(rect) for rect in self._register_rects[2:]],
+            MapsTab.CURATED: [tuple(rect) for rect in back_and_tabs + [r for _, _, r in self._curated_card_rects]],
+            MapsTab.PROCEDURAL: [tuple(rect) for rect in back_and_tabs + [r for _, _, r in self._procedural_card_rects]],
+            GameState.SETTINGS_SCREEN: [tuple(rect) for rect in [self._back_rect] + self._settings_item_rects],
+            GameState.LEADERBOARD_SCREEN: [tuple(self._back_rect)],
+        }
+        self._last_ui_signature = None
+        self._dirty = True
+        
+        # Prerendered backgrounds (login glow is shared with the register screen)
+        self._login_bg = self.build_login_background()
+        self._bg_main_menu = None
+        self._game_bg = self.build_game_background()
+        
+        # Idle curated cards, rebuilt when the set of unlocked levels changes
+        self._curated_panel = None
+        self._curated_panel_key = None
+        
+        # Leaderboard podium and list, rebuilt when DataManager.leaderboard_version moves
+        self._lb_panel = None
+        self._lb_panel_version = -1
+        
+        # HUD line, re-rendered only when level, score or lives change
+        self._hud_surf = None
+        self._hud_key = None
+        
+        # Offscreen play field; frozen once a game-over frame has been composited
+        self._game_canvas = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
+        self._game_canvas_frozen = False
+        
+        # Play field background with the live blocks already on it; rebuilt only when a block changes
+        self._block_layer = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
+        self._blocks_version = 0
+        self._block_layer_version = -1
+        
+        # Three-stop title underline (the old per-column lines were 4px tall)
+        self._grad_bar = pygame.Surface((220, 4))
+        self._grad_bar.fill(COLOR_CYAN, (0, 0, 73, 4))
+        self._grad_bar.fill(COLOR_PURPLE, (73, 0, 73, 4))
+        self._grad_bar.fill(COLOR_ORANGE, (146, 0, 74, 4))
+        self._grad_bar = self._grad_bar.convert()
+        
+        # Rendered text surfaces keyed by (font, text, color), least recently used first
+        self._text_cache: OrderedDict = OrderedDict()
+        self._live_text: Dict[str, tuple] = {}
+        
+        # Composited glass panels keyed by (width, height, border_color, glow, radius)
+        self._glass_cache: Dict[tuple, pygame.Surface] = {}
+        self.prewarm_glass_cache()
+        
+        # Particle circles keyed by (color, size, alpha)
+        self._particle_sprites: Dict[tuple, pygame.Surface] = {}
+        
+        # Floating menu block sprites keyed by size
+        self._menu_block_sprites: Dict[int, pygame.Surface] = {}
+        
+        # In-game sprites with their glow baked in: blocks keyed by (color, width, height),
+        # paddle by (width, height), ball by radius
+        self._block_sprites: Dict[tuple, pygame.Surface] = {}
+        self._paddle_sprites: Dict[tuple, pygame.Surface] = {}
+        self._ball_sprites: Dict[int, pygame.Surface] = {}
+    
+    def layout_auth_card(self, card_height: int,
+                         button_offset: int) -> Tuple[pygame.Rect, pygame.Rect, pygame.Rect, pygame.Rect]:
+        """Rects of the auth card"""
+        card_x = SCREEN_WIDTH // 2 - 250
+        card_y = SCREEN_HEIGHT // 2 - card_height // 2 + 20
+        input_x = card_x + 40
+        return (
+            pygame.Rect(input_x, card_y + 80, 420, 50),
+            pygame.Rect(input_x, card_y + 180, 420, 50),
+            pygame.Rect(input_x, card_y + button_offset, 200, 55),
+            pygame.Rect(input_x + 220, card_y + button_offset, 200, 55),
+        )
+    
+    def layout_cards(self, count: int, cols: int, card_width: int, card_height: int,
+                     spacing: int) -> List[Tuple[int, int, pygame.Rect]]:
+        """Position and rect of each card in a map grid"""
+        start_x, start_y = CARD_GRID_ORIGIN
+        cards = []
+        for i in range(count):
+            row, col = i // cols, i % cols
+            x = start_x + col * (card_width + spacing)
+            y = start_y + row * (card_height + spacing)
+            cards.append((x, y, pygame.Rect(x, y, card_width, card_height)))
+        return cards
+    
+    def card_index_at(self, mx: int, my: int, count: int, cols: int, card_width: int, card_height: int,
+                      spacing: int) -> Optional[int]:
+        """Card index under the mouse"""
+        col, dx = divmod(mx - CARD_GRID_ORIGIN[0], card_width + spacing)
+        row, dy = divmod(my - CARD_GRID_ORIGIN[1], card_height + spacing)
+        if 0 <= col < cols and row >= 0 and dx < card_width and dy < card_height:
+            index = row * cols + col
+            if index < count:
+                return index
+        return None
+    
+    def build_hit_zones(self) -> Dict[object, List[Tuple[Tuple[int, int, int, int], Callable[[], None]]]]:
+        """Click zones per screen"""
+        # Maps tabs and the game-over overlay get their own entries
+        to_main_menu = partial(self.change_state, GameState.MAIN_MENU)
+        to_maps = partial(self.change_state, GameState.MAPS_SCREEN)
+        back = (tuple(self._back_rect), to_main_menu)
+        tabs = [(tuple(self._curated_tab_rect), partial(setattr, self, 'maps_tab', MapsTab.CURATED)),
+                (tuple(self._procedural_tab_rect), partial(setattr, self, 'maps_tab', MapsTab.PROCEDURAL))]
+        pause = (tuple(self._pause_rect), to_maps)
+        retry_rect, menu_rect = self._overlay_button_rects
+        
+        return {
+            GameState.MAIN_MENU: [
+                (tuple(rect), self.logout if next_state == GameState.LOGIN else partial(self.change_state, next_state))
+                for rect, (_, _, next_state) in zip(self._menu_button_rects, self._menu_buttons)
+            ],
+            MapsTab.CURATED: [back, *tabs] + [
+                (tuple(rect), partial(self.select_curated_level, i + 1))
+                for i, (_, _, rect) in enumerate(self._curated_card_rects)
+            ],
+            MapsTab.PROCEDURAL: [back, *tabs] + [
+                (tuple(rect), partial(self.start_level, 101 + i))
+                for i, (_, _, rect) in enumerate(self._procedural_card_rects)
+            ],
+            GameState.GAME_SCREEN: [pause],
+            'game_over': [(tuple(retry_rect), self.retry_level), (tuple(menu_rect), to_maps), pause],
+            GameState.SETTINGS_SCREEN: [back,
+                                        (tuple(self._settings_item_rects[0]), self.toggle_particle_effects),
+                                        (tuple(self._settings_item_rects[2]), self.toggle_show_fps)],
+            GameState.LEADERBOARD_SCREEN: [back],
+        }
+    
+    def dispatch_click(self, zones: List[Tuple[Tuple[int, int, int, int], Callable[[], None]]]):
+        """Dispatch a click to its zone"""
+        if not self.mouse_clicked:
+            return
+        mx, my = self.mouse_x, self.mouse_y
+        for (x, y, w, h), handler in zones:
+            if x <= mx < x + w and y <= my < y + h:
+                handler()
+                break
+    
+    def ui_signature(self) -> Optional[tuple]:
+        """Snapshot of what a static screen shows"""
+        # None while an animated screen is up
+        if self.state not in STATIC_SCREENS:
+            return None
+        key = self.maps_tab if self.state == GameState.MAPS_SCREEN else self.state
+        mx, my = self.mouse_x, self.mouse_y
+        hovered = next((i for i, (x, y, w, h) in enumerate(self._hover_rects[key])
+                        if x <= mx < x + w and y <= my < y + h), -1)
+        return (key, hovered, self.input_active, self.username_input, self.password_input,
+                self.error_message, self.success_message, self.settings.particle_effects,
+                self.settings.show_fps, self.data_manager.leaderboard_version, len(self.unlocked_levels))
+    
+    def change_state(self, state: GameState):
+        """Switch to another screen"""
+        self.state = state
+    
+    def schedule_state(self, state: GameState, delay: float):
+        """Switch screens after a delay"""
+        # Dropped if the user leaves the current screen before it is due
+        self._pending_state = (self.state, state, self.time + delay)
+    
+    def logout(self):
+        """Forget the current user and return to the login screen"""
+        self.current_user = None
+        self.username_input = ""
+        self.password_input = ""
+        self.state = GameState.LOGIN
+    
+    def select_curated_level(self, level_id: int):
+        """Start a curated level if it has been unlocked"""
+        if level_id in self.unlocked_levels:
+            self.start_level(level_id)
+    
+    def retry_level(self):
+        """Restart the current level from the game-over overlay"""
+        self.start_level(self.current_level)
+    
+    def toggle_particle_effects(self):
+        """Toggle particle effects"""
+        self.settings.particle_effects = not self.settings.particle_effects
+    
+    def toggle_show_fps(self):
+        """Toggle the FPS counter"""
+        self.settings.show_fps = not self.settings.show_fps
+    
+    def build_login_background(self) -> pygame.Surface:
+        """Render the login radial glow once with NumPy"""
+        glow = radial_glow(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 30, 20)
+        arr = np.stack([BG_DARK[0] + glow * 0.5,
+                        BG_DARK[1] + glow * 1.2,
+                        BG_DARK[2] + glow * 1.0], axis=-1).astype(np.uint8)
+        return pygame.surfarray.make_surface(arr).convert()
+    
+    def build_main_menu_background(self) -> pygame.Surface:
+        """Render the main menu's two corner glows once with NumPy"""
+        glow_tl = radial_glow(round(SCREEN_WIDTH*0.2), round(SCREEN_HEIGHT*0.2), 40, 15)
+        glow_br = radial_glow(round(SCREEN_WIDTH*0.8), round(SCREEN_HEIGHT*0.8), 40, 15)
+        
+        arr = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+        arr[..., 0] = BG_DARK[0] + (glow_tl * 0.3 + glow_br * 0.15).astype(np.uint8)
+        arr[..., 1] = BG_DARK[1] + (glow_tl * 0.8 + glow_br * 0.4).astype(np.uint8)
+        arr[..., 2] = BG_DARK[2] + (glow_tl * 0.8 + glow_br * 0.1).astype(np.uint8)
+        
+        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.surfarray.blit_array(surf, arr)
+        return surf.convert()
+    
+    def build_game_background(self) -> pygame.Surface:
+        """Pre-render the game backdrop"""
+        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surf.fill(BG_DARK)
+        canvas_x = (SCREEN_WIDTH - CANVAS_WIDTH) // 2
+        canvas_y = (SCREEN_HEIGHT - CANVAS_HEIGHT) // 2 + 25
+        for i in range(3):
+            glow_rect = pygame.Rect(canvas_x - 3 - i*2, canvas_y - 3 - i*2, CANVAS_WIDTH + 6 + i*4, CANVAS_HEIGHT + 6 + i*4)
+            pygame.draw.rect(surf, (*COLOR_CYAN, 60 - i*20), glow_rect, 2)
+        return surf.convert()
     
     def create_floating_blocks(self):
         """Create floating decorative blocks for menu"""
         return [
-            {'x': SCREEN_WIDTH * 0.75, 'y': SCREEN_HEIGHT * 0.15, 'size': 70, 'offset': 0},
-            {'x': SCREEN_WIDTH * 0.82, 'y': SCREEN_HEIGHT * 0.45, 'size': 55, 'offset': 1},
-            {'x': SCREEN_WIDTH * 0.70, 'y': SCREEN_HEIGHT * 0.70, 'size': 90, 'offset': 2},
-            {'x': SCREEN_WIDTH * 0.62, 'y': SCREEN_HEIGHT * 0.25, 'size': 65, 'offset': 1.5},
+            FloatingBlock(SCREEN_WIDTH * 0.75, SCREEN_HEIGHT * 0.15, 70, 0),
+            FloatingBlock(SCREEN_WIDTH * 0.82, SCREEN_HEIGHT * 0.45, 55, 1),
+            FloatingBlock(SCREEN_WIDTH * 0.70, SCREEN_HEIGHT * 0.70, 90, 2),
+            FloatingBlock(SCREEN_WIDTH * 0.62, SCREEN_HEIGHT * 0.25, 65, 1.5),
         ]
     
     def seeded_random(self, seed: int):
@@ -283,11 +805,19 @@ class BlockSmasher:
         state = seed
         def rand():
             nonlocal state
-            state = (state * 1664525 + 1013904223) % 4294967296
-            return state / 4294967296
+            state = (state * 1664525 + 1013904223) & 0xFFFFFFFF
+            return state * 2.3283064365386963e-10  # 1 / 2**32, exact
         return rand
     
     def generate_blocks_for_level(self, level: int) -> List[Block]:
+        """Fresh blocks for a level"""
+        layout = self._level_layouts.get(level)
+        if layout is None:
+            layout = [(b.x, b.y, b.width, b.height, b.color) for b in self.build_level_blocks(level)]
+            self._level_layouts[level] = layout
+        return [Block(x, y, w, h, True, color) for x, y, w, h, color in layout]
+    
+    def build_level_blocks(self, level: int) -> List[Block]:
         """Generate blocks based on level"""
         blocks = []
         
@@ -404,13 +934,16 @@ class BlockSmasher:
     
     def _generate_cluster(self, blocks, pattern, cx, cy, count, bw, bh, color, rand_fn, margin, max_y):
         """Helper to generate block clusters"""
+        x_max = CANVAS_WIDTH - margin - bw
+        y_max = max_y - bh
+        cos, sin = math.cos, math.sin
         if pattern == 'tight':
             rows, cols = 2, (count + 1) // 2
             gap = 3 + rand_fn() * 4
             for i in range(count):
                 row, col = i // cols, i % cols
                 x, y = cx + col * (bw + gap), cy + row * (bh + gap)
-                if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
+                if margin <= x <= x_max and margin <= y <= y_max:
                     blocks.append(Block(x, y, bw, bh, True, color))
         
         elif pattern == 'scattered':
@@ -418,17 +951,18 @@ class BlockSmasher:
             for i in range(count):
                 angle = (i / count) * 2 * math.pi + rand_fn() * 0.6
                 r = radius * (0.6 + rand_fn() * 0.7)
-                x, y = cx + math.cos(angle) * r, cy + math.sin(angle) * r
-                if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
+                x, y = cx + cos(angle) * r, cy + sin(angle) * r
+                if margin <= x <= x_max and margin <= y <= y_max:
                     blocks.append(Block(x, y, bw, bh, True, color))
         
         elif pattern == 'line':
             angle = rand_fn() * math.pi / 3 - math.pi / 6
             spacing = bw + 2 + rand_fn() * 6
+            cos_a, sin_a = cos(angle), sin(angle)
             for i in range(count):
-                x = cx + i * spacing * math.cos(angle)
-                y = cy + i * spacing * math.sin(angle) + math.sin(i * 0.9) * 12
-                if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
+                x = cx + i * spacing * cos_a
+                y = cy + i * spacing * sin_a + (LINE_WAVE[i] if i < len(LINE_WAVE) else sin(i * 0.9) * 12)
+                if margin <= x <= x_max and margin <= y <= y_max:
                     blocks.append(Block(x, y, bw, bh, True, color))
         
         elif pattern == 'arc':
@@ -438,17 +972,16 @@ class BlockSmasher:
             for i in range(count):
                 t = i / (count - 1) if count > 1 else 0
                 angle = start_angle + t * arc_length
-                x, y = cx + math.cos(angle) * arc_radius, cy + math.sin(angle) * arc_radius
-                if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
+                x, y = cx + cos(angle) * arc_radius, cy + sin(angle) * arc_radius
+                if margin <= x <= x_max and margin <= y <= y_max:
                     blocks.append(Block(x, y, bw, bh, True, color))
         
         elif pattern == 'spiral':
             spiral_tightness = 3 + rand_fn() * 4
-            for i in range(count):
-                angle = (i / count) * math.pi * 2 * 1.5
-                radius = 10 + (i / count) * spiral_tightness * 15
-                x, y = cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
-                if margin <= x <= CANVAS_WIDTH - margin - bw and margin <= y <= max_y - bh:
+            for cos_a, sin_a, t in spiral_offsets(count):
+                radius = 10 + t * spiral_tightness * 15
+                x, y = cx + cos_a * radius, cy + sin_a * radius
+                if margin <= x <= x_max and margin <= y <= y_max:
                     blocks.append(Block(x, y, bw, bh, True, color))
     
     def start_level(self, level: int):
@@ -458,40 +991,70 @@ class BlockSmasher:
         self.score = 0
         self.ball_launched = False
         self.paddle_x = CANVAS_WIDTH // 2 - 60
+        self._paddle_mouse_x = None
         self.ball_x = CANVAS_WIDTH // 2
         self.ball_y = CANVAS_HEIGHT - 100
         self.ball_vx = 0
         self.ball_vy = 0
         self.blocks = self.generate_blocks_for_level(level)
-        self.particles = []
+        self.blocks_remaining = len(self.blocks)
+        self._blocks_version += 1
+        self.build_block_grid()
+        self.particles.clear()
         self.game_over_type = None
         self.state = GameState.GAME_SCREEN
     
+    def build_block_grid(self):
+        """Build the block collision grid"""
+        # Each cell lists (index, left, right, top, bottom) of every live block overlapping it
+        grid: Dict[Tuple[int, int], List[Tuple[int, float, float, float, float]]] = {}
+        block_cells: List[List[Tuple[int, int]]] = []
+        r = self.ball_radius
+        for index, block in enumerate(self.blocks):
+            cells = []
+            block_cells.append(cells)
+            if not block.alive:
+                continue
+            left, right = block.x - r, block.x + block.width + r
+            top, bottom = block.y - r, block.y + block.height + r
+            hitbox = (index, left, right, top, bottom)
+            for gx in range(int(left // BLOCK_GRID_CELL), int(right // BLOCK_GRID_CELL) + 1):
+                for gy in range(int(top // BLOCK_GRID_CELL), int(bottom // BLOCK_GRID_CELL) + 1):
+                    grid.setdefault((gx, gy), []).append(hitbox)
+                    cells.append((gx, gy))
+        self.block_grid = grid
+        self._block_cells = block_cells
+    
     def create_particles(self, x: float, y: float, count: int, color: Tuple[int, int, int]):
         """Create particle explosion"""
         if not self.settings.particle_effects:
             return
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
-            self.particles.append(Particle(
-                x, y,
-                math.cos(angle) * speed,
-                math.sin(angle) * speed,
-                1.0, 1.0, random.uniform(2, 4),
-                color
-            ))
+        self.particles.emit(x, y, count, color)
+    
+    def try_launch_ball(self):
+        """Launch the ball if resting"""
+        if self.state == GameState.GAME_SCREEN and not self.game_over_type and not self.ball_launched:
+            self.ball_launched = True
+            self.ball_vx = self._launch_vx[self._launch_idx % LAUNCH_VECTORS]
+            self._launch_idx += 1
+            self.ball_vy = -6
     
     def update_game(self):
         """Update game physics"""
         if self.game_over_type:
             return
         
-        # Move paddle
+        # Move paddle: held arrow keys are polled from SDL's key state, and the mouse
+        # takes over again once it moves
         canvas_x = (SCREEN_WIDTH - CANVAS_WIDTH) // 2
         adjusted_mouse_x = self.mouse_x - canvas_x
+        keys = pygame.key.get_pressed()
+        direction = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
         
-        if 0 <= adjusted_mouse_x <= CANVAS_WIDTH:
+        if direction:
+            self.paddle_x = max(0, min(self.paddle_x + direction * PADDLE_SPEED, CANVAS_WIDTH - self.paddle_width))
+        elif adjusted_mouse_x != self._paddle_mouse_x and 0 <= adjusted_mouse_x <= CANVAS_WIDTH:
+            self._paddle_mouse_x = adjusted_mouse_x
             self.paddle_x = adjusted_mouse_x - self.paddle_width // 2
             self.paddle_x = max(0, min(self.paddle_x, CANVAS_WIDTH - self.paddle_width))
         
@@ -500,42 +1063,53 @@ class BlockSmasher:
             self.ball_x = self.paddle_x + self.paddle_width // 2
             self.ball_y = CANVAS_HEIGHT - 100
         else:
-            # Update ball
-            self.ball_x += self.ball_vx
-            self.ball_y += self.ball_vy
+            # Ball state lives in locals for the whole step and is stored back once
+            ball_x, ball_y = self.ball_x + self.ball_vx, self.ball_y + self.ball_vy
+            ball_vx, ball_vy = self.ball_vx, self.ball_vy
+            r = self.ball_radius
             
             # Wall collision
-            if self.ball_x - self.ball_radius <= 0 or self.ball_x + self.ball_radius >= CANVAS_WIDTH:
-                self.ball_vx = -self.ball_vx
-                self.ball_x = max(self.ball_radius, min(self.ball_x, CANVAS_WIDTH - self.ball_radius))
-                self.create_particles(self.ball_x, self.ball_y, 8, COLOR_CYAN)
+            if ball_x - r <= 0 or ball_x + r >= CANVAS_WIDTH:
+                ball_vx = -ball_vx
+                ball_x = max(r, min(ball_x, CANVAS_WIDTH - r))
+                self.create_particles(ball_x, ball_y, 8, COLOR_CYAN)
             
-            if self.ball_y - self.ball_radius <= 0:
-                self.ball_vy = -self.ball_vy
-                self.ball_y = self.ball_radius
-                self.create_particles(self.ball_x, self.ball_y, 8, COLOR_CYAN)
+            if ball_y - r <= 0:
+                ball_vy = -ball_vy
+                ball_y = r
+                self.create_particles(ball_x, ball_y, 8, COLOR_CYAN)
             
             # Paddle collision
+            paddle_x, paddle_width = self.paddle_x, self.paddle_width
             paddle_y = CANVAS_HEIGHT - 40
-            if (self.paddle_x <= self.ball_x <= self.paddle_x + self.paddle_width and
-                paddle_y - self.ball_radius <= self.ball_y <= paddle_y + self.paddle_height):
-                hit_pos = (self.ball_x - (self.paddle_x + self.paddle_width / 2)) / (self.paddle_width / 2)
-                self.ball_vx = hit_pos * 5
-                self.ball_vy = -abs(self.ball_vy)
-                self.ball_y = paddle_y - self.ball_radius
-                self.create_particles(self.ball_x, self.ball_y, 12, COLOR_PURPLE)
+            if (paddle_x <= ball_x <= paddle_x + paddle_width and
+                paddle_y - r <= ball_y <= paddle_y + self.paddle_height):
+                hit_pos = (ball_x - (paddle_x + paddle_width / 2)) / (paddle_width / 2)
+                ball_vx = hit_pos * 5
+                ball_vy = -abs(ball_vy)
+                ball_y = paddle_y - r
+                self.create_particles(ball_x, ball_y, 12, COLOR_PURPLE)
+            
+            self.ball_x, self.ball_y, self.ball_vx, self.ball_vy = ball_x, ball_y, ball_vx, ball_vy
             
             # Block collision
-            for block in self.blocks:
-                if not block.alive:
+            cell = (int(ball_x // BLOCK_GRID_CELL), int(ball_y // BLOCK_GRID_CELL))
+            for hitbox in self.block_grid.get(cell, ()):
+                index, left, right, top, bottom = hitbox
+                if not (left <= ball_x <= right and top <= ball_y <= bottom):
                     continue
-                if (block.x - self.ball_radius <= self.ball_x <= block.x + block.width + self.ball_radius and
-                    block.y - self.ball_radius <= self.ball_y <= block.y + block.height + self.ball_radius):
-                    block.alive = False
-                    self.ball_vy = -self.ball_vy
-                    self.score += 100
-                    self.create_particles(block.x + block.width / 2, block.y + block.height / 2, 20, block.color)
-                    break
+                block = self.blocks[index]
+                block.alive = False
+                self.blocks_remaining -= 1
+                self._blocks_version += 1
+                self.ball_vy = -self.ball_vy
+                self.score += 100
+                self.create_particles(block.x + block.width / 2, block.y + block.height / 2, 20, block.color)
+                
+                # Dead blocks leave the grid so later steps never test them again
+                for key in self._block_cells[index]:
+                    self.block_grid[key].remove(hitbox)
+                break
             
             # Ball fell
             if self.ball_y > CANVAS_HEIGHT:
@@ -551,16 +1125,10 @@ class BlockSmasher:
                     self.ball_vy = 0
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.x += particle.vx
-            particle.y += particle.vy
-            particle.vy += 0.3
-            particle.life -= 0.015
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        self.particles.update(0.3, 0.015)
         
         # Victory check
-        if all(not block.alive for block in self.blocks) and not self.game_over_type:
+        if self.blocks_remaining == 0 and not self.game_over_type:
             self.game_over_type = 'victory'
             # Save score to leaderboard
             if self.current_user and self.score > 0:
@@ -570,79 +1138,143 @@ class BlockSmasher:
             if self.current_level + 1 not in self.unlocked_levels and self.current_level < 100:
                 self.unlocked_levels.append(self.current_level + 1)
     
+    def render_text(self, font, text: str, color) -> pygame.Surface:
+        """Render text once and reuse the surface on later frames"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > 512:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+    
+    def render_live_text(self, slot: str, font, text: str, color) -> pygame.Surface:
+        """Render user-typed text"""
+        # One surface per slot, so typing never churns the shared text cache
+        key = (id(font), text, color)
+        cached = self._live_text.get(slot)
+        if cached is None or cached[0] != key:
+            cached = (key, font.render(text, True, color).convert_alpha())
+            self._live_text[slot] = cached
+        return cached[1]
+    
     def draw_glow_text(self, text: str, font, color: Tuple[int, int, int], x: int, y: int, center=False):
         """Draw text with glow effect"""
         # Glow layers
+        glow_surf = self.render_text(font, text, rgba(color, 80) if len(color) == 3 else color)
         for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-            glow_surf = font.render(text, True, (*color[:3], 80) if len(color) == 3 else color)
             rect = glow_surf.get_rect(center=(x + offset[0], y + offset[1])) if center else glow_surf.get_rect(topleft=(x + offset[0], y + offset[1]))
             self.screen.blit(glow_surf, rect)
         
         # Main text
-        text_surf = font.render(text, True, color)
+        text_surf = self.render_text(font, text, color)
         rect = text_surf.get_rect(center=(x, y)) if center else text_surf.get_rect(topleft=(x, y))
         self.screen.blit(text_surf, rect)
         return rect
     
-    def draw_glass_rect(self, x: int, y: int, width: int, height: int, 
-                       border_color: Tuple[int, int, int], glow: bool = False, radius: int = 12):
-        """Draw glass morphism rectangle"""
+    def build_glass_surface(self, width: int, height: int, border_color: Tuple[int, int, int],
+                            glow: bool, radius: int) -> pygame.Surface:
+        """Composite a glass panel with a 6px margin for its glow"""
+        # Collect the layers first; they are flattened together at the end
+        layers = []
+        
         # Background
         s = pygame.Surface((width, height), pygame.SRCALPHA)
         s.fill(GLASS_BG)
-        self.screen.blit(s, (x, y))
+        layers.append((s, (6, 6)))
         
         # Glow
         if glow:
             for i in range(3):
-                glow_rect = pygame.Rect(x - i*3, y - i*3, width + i*6, height + i*6)
                 s_glow = pygame.Surface((width + i*6, height + i*6), pygame.SRCALPHA)
                 pygame.draw.rect(s_glow, (*border_color, 30 - i*10), (0, 0, width + i*6, height + i*6), border_radius=radius+i*2)
-                self.screen.blit(s_glow, (x - i*3, y - i*3))
+                layers.append((s_glow, (6 - i*3, 6 - i*3)))
         
         # Border
-        pygame.draw.rect(self.screen, border_color, (x, y, width, height), 2, border_radius=radius)
+        border = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(border, border_color, (0, 0, width, height), 2, border_radius=radius)
+        layers.append((border, (6, 6)))
+        
+        # The glow rings overlap each other at low alpha, so straight-alpha blits
+        # would darken the translucent edge; premultiplied keeps it as on screen
+        surface = pygame.Surface((width + 12, height + 12), pygame.SRCALPHA)
+        for layer, pos in layers:
+            surface.blit(layer.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+        return surface.convert_alpha()
+    
+    def get_glass_surface(self, width: int, height: int, border_color: Tuple[int, int, int],
+                          glow: bool, radius: int) -> pygame.Surface:
+        """Cached glass panel"""
+        key = (width, height, border_color, glow, radius)
+        surface = self._glass_cache.get(key)
+        if surface is None:
+            if len(self._glass_cache) >= 128:
+                self._glass_cache.clear()
+            surface = self._glass_cache[key] = self.build_glass_surface(width, height, border_color, glow, radius)
+        return surface
+    
+    def prewarm_glass_cache(self):
+        """Pre-render menu glass panels"""
+        # Both hover states of the post-login buttons and cards, so the first hover doesn't stall
+        panels = [
+            (340, 50, COLOR_CYAN),            # main menu buttons
+            (140, 45, COLOR_CYAN),            # back
+            (200, 45, COLOR_CYAN),            # curated tab
+            (220, 45, COLOR_PURPLE),          # procedural tab
+            (400, 135, COLOR_CYAN),           # curated cards
+            (295, 120, COLOR_PURPLE),         # procedural cards
+            (65, 45, COLOR_ORANGE),           # pause
+            (210, 65, COLOR_PURPLE),          # retry
+            (210, 65, COLOR_CYAN),            # menu
+            (560, 65, COLOR_PURPLE),          # settings items
+        ]
+        for width, height, color in panels:
+            for glow in (False, True):
+                self.get_glass_surface(width, height, color, glow, 12)
+    
+    def draw_glass_rect(self, x: int, y: int, width: int, height: int, 
+                       border_color: Tuple[int, int, int], glow: bool = False, radius: int = 12):
+        """Draw glass morphism rectangle"""
+        self.screen.blit(self.get_glass_surface(width, height, border_color, glow, radius), (x - 6, y - 6),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
     
     def draw_button(self, text: str, x: int, y: int, width: int, height: int,
                    color: Tuple[int, int, int], icon: str = None) -> bool:
         """Draw glass button and return if hovered"""
-        rect = pygame.Rect(x, y, width, height)
-        is_hover = rect.collidepoint(self.mouse_x, self.mouse_y)
+        is_hover = x <= self.mouse_x < x + width and y <= self.mouse_y < y + height
         
         self.draw_glass_rect(x, y, width, height, color, is_hover)
         
+        blit_list = []
+        
         # Icon
         icon_x = x + 20
         if icon:
-            icon_surf = self.font_small.render(icon, True, color)
-            self.screen.blit(icon_surf, (icon_x, y + height // 2 - 12))
+            icon_surf = self.render_text(self.font_small, icon, color)
+            blit_list.append((icon_surf, (icon_x, y + height // 2 - 12)))
             icon_x += 40
         
         # Text
-        text_surf = self.font_medium.render(text, True, color)
+        text_surf = self.render_text(self.font_medium, text, color)
         text_rect = text_surf.get_rect(midleft=(icon_x, y + height // 2))
-        self.screen.blit(text_surf, text_rect)
+        blit_list.append((text_surf, text_rect))
+        
+        self.screen.blits(blit_list, doreturn=False)
         
         return is_hover
     
     def draw_login_screen(self):
         """Draw login screen"""
-        self.screen.fill(BG_DARK)
-        
         # Background gradient effect
-        for y in range(0, SCREEN_HEIGHT, 4):
-            for x in range(0, SCREEN_WIDTH, 8):
-                dist = math.sqrt((x - SCREEN_WIDTH//2)**2 + (y - SCREEN_HEIGHT//2)**2)
-                glow = max(0, 30 - dist / 20)
-                r = BG_DARK[0] + int(glow * 0.5)
-                g = BG_DARK[1] + int(glow * 1.2)
-                b = BG_DARK[2] + int(glow * 1.0)
-                pygame.draw.rect(self.screen, (r, g, b), (x, y, 8, 4))
+        self.screen.blit(self._login_bg, (0, 0))
         
         # Title
         self.draw_glow_text("BLOCK SMASHER", self.font_title, COLOR_CYAN, SCREEN_WIDTH // 2, 120, center=True)
         
-        subtitle = self.font_small.render("Login to Continue", True, COLOR_FOREGROUND)
+        subtitle = self.render_text(self.font_small, "Login to Continue", COLOR_FOREGROUND)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -653,6 +1285,9 @@ class BlockSmasher:
         
         self.draw_glass_rect(card_x, card_y, card_width, card_height, COLOR_CYAN, True)
         
+        # Text on the card is collected and blitted in one batch at the end
+        blit_list = []
+        
         # Username input
         input_width = 420
         input_height = 50
@@ -663,13 +1298,14 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, username_y, input_width, input_height, 
                            COLOR_CYAN if username_active else COLOR_BORDER, username_active)
         
-        username_label = self.font_small.render("Username:", True, COLOR_FOREGROUND)
-        self.screen.blit(username_label, (input_x, username_y - 30))
+        username_label = self.render_text(self.font_small, "Username:", COLOR_FOREGROUND)
+        blit_list.append((username_label, (input_x, username_y - 30)))
         
-        username_display = self.username_input if self.username_input else "Enter username..."
-        username_text = self.font_small.render(username_display, True, 
-                                               COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
-        self.screen.blit(username_text, (input_x + 15, username_y + 13))
+        if self.username_input:
+            username_text = self.render_live_text("username", self.font_small, self.username_input, COLOR_FOREGROUND)
+        else:
+            username_text = self.render_text(self.font_small, "Enter username...", COLOR_FOREGROUND_A100)
+        blit_list.append((username_text, (input_x + 15, username_y + 13)))
         
         # Password input
         password_y = card_y + 180
@@ -677,18 +1313,16 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, password_y, input_width, input_height,
                            COLOR_CYAN if password_active else COLOR_BORDER, password_active)
         
-        password_label = self.font_small.render("Password:", True, COLOR_FOREGROUND)
-        self.screen.blit(password_label, (input_x, password_y - 30))
+        password_label = self.render_text(self.font_small, "Password:", COLOR_FOREGROUND)
+        blit_list.append((password_label, (input_x, password_y - 30)))
         
-        password_display = "*" * len(self.password_input) if self.password_input else "Enter password..."
-        password_text = self.font_small.render(password_display, True,
-                                               COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
-        self.screen.blit(password_text, (input_x + 15, password_y + 13))
+        password_display = PASSWORD_MASKS[len(self.password_input)] if self.password_input else "Enter password..."
+        password_text = self.render_text(self.font_small, password_display,
+                                         COLOR_FOREGROUND if self.password_input else COLOR_FOREGROUND_A100)
+        blit_list.append((password_text, (input_x + 15, password_y + 13)))
         
         # Buttons
-        login_btn_y = card_y + 280
-        login_btn_rect = pygame.Rect(input_x, login_btn_y, 200, 55)
-        register_btn_rect = pygame.Rect(input_x + 220, login_btn_y, 200, 55)
+        username_rect, password_rect, login_btn_rect, register_btn_rect = self._login_rects
         
         login_hover = login_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
         register_hover = register_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -698,14 +1332,14 @@ class BlockSmasher:
         self.draw_glass_rect(register_btn_rect.x, register_btn_rect.y, register_btn_rect.width, register_btn_rect.height,
                            COLOR_PURPLE, register_hover)
         
-        login_text = self.font_medium.render("LOGIN", True, COLOR_CYAN)
-        register_text = self.font_medium.render("REGISTER", True, COLOR_PURPLE)
+        login_text = self.render_text(self.font_medium, "LOGIN", COLOR_CYAN)
+        register_text = self.render_text(self.font_medium, "REGISTER", COLOR_PURPLE)
         
         login_text_rect = login_text.get_rect(center=login_btn_rect.center)
         register_text_rect = register_text.get_rect(center=register_btn_rect.center)
         
-        self.screen.blit(login_text, login_text_rect)
-        self.screen.blit(register_text, register_text_rect)
+        blit_list.append((login_text, login_text_rect))
+        blit_list.append((register_text, register_text_rect))
         
         # Click handlers
         if self.mouse_clicked:
@@ -725,40 +1359,33 @@ class BlockSmasher:
                 pass
             else:
                 # Check if clicked on username or password field
-                if pygame.Rect(input_x, username_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                if username_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "username"
-                elif pygame.Rect(input_x, password_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                elif password_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "password"
         
         # Error/Success messages
         if self.error_message:
-            error_surf = self.font_small.render(self.error_message, True, COLOR_ERROR)
+            error_surf = self.render_text(self.font_small, self.error_message, COLOR_ERROR)
             error_rect = error_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 30))
-            self.screen.blit(error_surf, error_rect)
+            blit_list.append((error_surf, error_rect))
         
         if self.success_message:
-            success_surf = self.font_small.render(self.success_message, True, COLOR_SUCCESS)
+            success_surf = self.render_text(self.font_small, self.success_message, COLOR_SUCCESS)
             success_rect = success_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 30))
-            self.screen.blit(success_surf, success_rect)
+            blit_list.append((success_surf, success_rect))
+        
+        self.screen.blits(blit_list, doreturn=False)
     
     def draw_register_screen(self):
         """Draw registration screen"""
-        self.screen.fill(BG_DARK)
-        
         # Background gradient effect
-        for y in range(0, SCREEN_HEIGHT, 4):
-            for x in range(0, SCREEN_WIDTH, 8):
-                dist = math.sqrt((x - SCREEN_WIDTH//2)**2 + (y - SCREEN_HEIGHT//2)**2)
-                glow = max(0, 30 - dist / 20)
-                r = BG_DARK[0] + int(glow * 0.5)
-                g = BG_DARK[1] + int(glow * 1.2)
-                b = BG_DARK[2] + int(glow * 1.0)
-                pygame.draw.rect(self.screen, (r, g, b), (x, y, 8, 4))
+        self.screen.blit(self._login_bg, (0, 0))
         
         # Title
         self.draw_glow_text("BLOCK SMASHER", self.font_title, COLOR_PURPLE, SCREEN_WIDTH // 2, 120, center=True)
         
-        subtitle = self.font_small.render("Create New Account", True, COLOR_FOREGROUND)
+        subtitle = self.render_text(self.font_small, "Create New Account", COLOR_FOREGROUND)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -769,6 +1396,9 @@ class BlockSmasher:
         
         self.draw_glass_rect(card_x, card_y, card_width, card_height, COLOR_PURPLE, True)
         
+        # Text on the card is collected and blitted in one batch at the end
+        blit_list = []
+        
         # Username input
         input_width = 420
         input_height = 50
@@ -779,13 +1409,14 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, username_y, input_width, input_height,
                            COLOR_PURPLE if username_active else COLOR_BORDER, username_active)
         
-        username_label = self.font_small.render("Username (min 3 chars):", True, COLOR_FOREGROUND)
-        self.screen.blit(username_label, (input_x, username_y - 30))
+        username_label = self.render_text(self.font_small, "Username (min 3 chars):", COLOR_FOREGROUND)
+        blit_list.append((username_label, (input_x, username_y - 30)))
         
-        username_display = self.username_input if self.username_input else "Enter username..."
-        username_text = self.font_small.render(username_display, True,
-                                               COLOR_FOREGROUND if self.username_input else (*COLOR_FOREGROUND, 100))
-        self.screen.blit(username_text, (input_x + 15, username_y + 13))
+        if self.username_input:
+            username_text = self.render_live_text("username", self.font_small, self.username_input, COLOR_FOREGROUND)
+        else:
+            username_text = self.render_text(self.font_small, "Enter username...", COLOR_FOREGROUND_A100)
+        blit_list.append((username_text, (input_x + 15, username_y + 13)))
         
         # Password input
         password_y = card_y + 180
@@ -793,18 +1424,16 @@ class BlockSmasher:
         self.draw_glass_rect(input_x, password_y, input_width, input_height,
                            COLOR_PURPLE if password_active else COLOR_BORDER, password_active)
         
-        password_label = self.font_small.render("Password (min 4 chars):", True, COLOR_FOREGROUND)
-        self.screen.blit(password_label, (input_x, password_y - 30))
+        password_label = self.render_text(self.font_small, "Password (min 4 chars):", COLOR_FOREGROUND)
+        blit_list.append((password_label, (input_x, password_y - 30)))
         
-        password_display = "*" * len(self.password_input) if self.password_input else "Enter password..."
-        password_text = self.font_small.render(password_display, True,
-                                               COLOR_FOREGROUND if self.password_input else (*COLOR_FOREGROUND, 100))
-        self.screen.blit(password_text, (input_x + 15, password_y + 13))
+        password_display = PASSWORD_MASKS[len(self.password_input)] if self.password_input else "Enter password..."
+        password_text = self.render_text(self.font_small, password_display,
+                                         COLOR_FOREGROUND if self.password_input else COLOR_FOREGROUND_A100)
+        blit_list.append((password_text, (input_x + 15, password_y + 13)))
         
         # Buttons
-        create_btn_y = card_y + 300
-        create_btn_rect = pygame.Rect(input_x, create_btn_y, 200, 55)
-        back_btn_rect = pygame.Rect(input_x + 220, create_btn_y, 200, 55)
+        username_rect, password_rect, create_btn_rect, back_btn_rect = self._register_rects
         
         create_hover = create_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
         back_hover = back_btn_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -814,14 +1443,14 @@ class BlockSmasher:
         self.draw_glass_rect(back_btn_rect.x, back_btn_rect.y, back_btn_rect.width, back_btn_rect.height,
                            COLOR_CYAN, back_hover)
         
-        create_text = self.font_medium.render("CREATE", True, COLOR_PURPLE)
-        back_text = self.font_medium.render("BACK", True, COLOR_CYAN)
+        create_text = self.render_text(self.font_medium, "CREATE", COLOR_PURPLE)
+        back_text = self.render_text(self.font_medium, "BACK", COLOR_CYAN)
         
         create_text_rect = create_text.get_rect(center=create_btn_rect.center)
         back_text_rect = back_text.get_rect(center=back_btn_rect.center)
         
-        self.screen.blit(create_text, create_text_rect)
-        self.screen.blit(back_text, back_text_rect)
+        blit_list.append((create_text, create_text_rect))
+        blit_list.append((back_text, back_text_rect))
         
         # Click handlers
         if self.mouse_clicked:
@@ -834,8 +1463,7 @@ class BlockSmasher:
                     self.current_user = self.username_input
                     self.username_input = ""
                     self.password_input = ""
-                    pygame.time.wait(500)  # Brief pause to show success
-                    self.state = GameState.MAIN_MENU
+                    self.schedule_state(GameState.MAIN_MENU, 0.5)  # Brief pause to show success
                 else:
                     self.error_message = message
                     self.success_message = ""
@@ -847,55 +1475,36 @@ class BlockSmasher:
                 self.password_input = ""
             else:
                 # Check if clicked on input fields
-                if pygame.Rect(input_x, username_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                if username_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "username"
-                elif pygame.Rect(input_x, password_y, input_width, input_height).collidepoint(self.mouse_x, self.mouse_y):
+                elif password_rect.collidepoint(self.mouse_x, self.mouse_y):
                     self.input_active = "password"
         
         # Error/Success messages
         if self.error_message:
-            error_surf = self.font_small.render(self.error_message, True, COLOR_ERROR)
+            error_surf = self.render_text(self.font_small, self.error_message, COLOR_ERROR)
             error_rect = error_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 30))
-            self.screen.blit(error_surf, error_rect)
+            blit_list.append((error_surf, error_rect))
         
         if self.success_message:
-            success_surf = self.font_small.render(self.success_message, True, COLOR_SUCCESS)
+            success_surf = self.render_text(self.font_small, self.success_message, COLOR_SUCCESS)
             success_rect = success_surf.get_rect(center=(SCREEN_WIDTH // 2, card_y + card_height + 30))
-            self.screen.blit(success_surf, success_rect)
+            blit_list.append((success_surf, success_rect))
+        
+        self.screen.blits(blit_list, doreturn=False)
     
     def draw_main_menu(self):
         """Draw main menu"""
         # Background gradient
-        for y in range(SCREEN_HEIGHT):
-            for x in range(0, SCREEN_WIDTH, 4):
-                dist_tl = math.sqrt((x - SCREEN_WIDTH*0.2)**2 + (y - SCREEN_HEIGHT*0.2)**2)
-                dist_br = math.sqrt((x - SCREEN_WIDTH*0.8)**2 + (y - SCREEN_HEIGHT*0.8)**2)
-                
-                glow_tl = max(0, 40 - dist_tl / 15)
-                glow_br = max(0, 40 - dist_br / 15)
-                
-                r = BG_DARK[0] + int(glow_tl * 0.3 + glow_br * 0.15)
-                g = BG_DARK[1] + int(glow_tl * 0.8 + glow_br * 0.4)
-                b = BG_DARK[2] + int(glow_tl * 0.8 + glow_br * 0.1)
-                
-                pygame.draw.line(self.screen, (r, g, b), (x, y), (x+4, y))
+        if self._bg_main_menu is None:
+            self._bg_main_menu = self.build_main_menu_background()
+        self.screen.blit(self._bg_main_menu, (0, 0))
         
-        # Floating blocks
-        for block in self.menu_blocks:
-            float_y = math.sin(self.time * 0.5 + block['offset']) * 15
-            size = block['size']
-            x, y = int(block['x']), int(block['y'] + float_y)
-            
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
-            s.fill((*COLOR_PURPLE, 60))
-            self.screen.blit(s, (x, y))
-            pygame.draw.rect(self.screen, COLOR_PURPLE, (x, y, size, size), 2, border_radius=8)
-            
-            for i in range(2):
-                glow_size = size + i*6
-                glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*COLOR_PURPLE, 20-i*10), (0, 0, glow_size, glow_size), border_radius=10)
-                self.screen.blit(glow_surf, (x-i*3, y-i*3))
+        # Floating blocks, all vertical offsets in one vectorized sin
+        block_ys = (self._menu_block_y + np.sin(self.time * 0.5 + self._menu_block_phases) * 15).astype(int)
+        self.screen.blits([(self.get_menu_block_sprite(block.size), (int(block.x) - 3, int(y) - 3),
+                            None, pygame.BLEND_PREMULTIPLIED)
+                           for block, y in zip(self.menu_blocks, block_ys)], doreturn=False)
         
         # Title
         title_x, title_y = 100, 160
@@ -904,50 +1513,61 @@ class BlockSmasher:
         
         # Gradient line
         line_y = title_y + 200
-        for i in range(220):
-            t = i / 220
-            if t < 0.33:
-                color = COLOR_CYAN
-            elif t < 0.66:
-                color = COLOR_PURPLE
-            else:
-                color = COLOR_ORANGE
-            pygame.draw.line(self.screen, color, (title_x + i, line_y), (title_x + i, line_y + 3))
+        self.screen.blit(self._grad_bar, (title_x, line_y))
+        
+        # Text is collected and blitted in one batch after the buttons
+        blit_list = []
         
         # Welcome message
-        welcome_text = self.font_small.render(f"Welcome, {self.current_user}!", True, COLOR_FOREGROUND)
-        self.screen.blit(welcome_text, (title_x, title_y - 50))
+        welcome_text = self.render_text(self.font_small, f"Welcome, {self.current_user}!", COLOR_FOREGROUND)
+        blit_list.append((welcome_text, (title_x, title_y - 50)))
         
         # Menu buttons
         button_x, button_y = 100, 420
         button_spacing = 65
         
-        buttons = [
-            ("▶", "PLAY", GameState.MAPS_SCREEN),
-            ("◆", "MAPS", GameState.MAPS_SCREEN),
-            ("★", "LEADERBOARD", GameState.LEADERBOARD_SCREEN),
-            ("⚙", "SETTINGS", GameState.SETTINGS_SCREEN),
-            ("⎋", "LOGOUT", GameState.LOGIN),
-        ]
+        buttons = self._menu_buttons
         
-        for i, (icon, text, next_state) in enumerate(buttons):
-            y = button_y + i * button_spacing
-            hover = self.draw_button(text, button_x, y, 340, 50, COLOR_CYAN, icon)
-            
-            if hover and self.mouse_clicked:
-                if next_state == GameState.LOGIN:
-                    self.current_user = None
-                    self.username_input = ""
-                    self.password_input = ""
-                self.state = next_state
+        for i, (icon, text, _) in enumerate(buttons):
+            self.draw_button(text, button_x, button_y + i * button_spacing, 340, 50, COLOR_CYAN, icon)
         
         # Info card
         info_y = button_y + len(buttons) * button_spacing + 20
         self.draw_glass_rect(button_x, info_y, 340, 70, COLOR_CYAN)
-        premium_text = self.font_small.render("PREMIUM EDITION", True, (*COLOR_FOREGROUND, 150))
-        version_text = self.font_tiny.render("Version 1.0.0", True, (*COLOR_FOREGROUND, 100))
-        self.screen.blit(premium_text, (button_x + 15, info_y + 12))
-        self.screen.blit(version_text, (button_x + 15, info_y + 42))
+        premium_text = self.render_text(self.font_small, "PREMIUM EDITION", COLOR_FOREGROUND_A150)
+        version_text = self.render_text(self.font_tiny, "Version 1.0.0", COLOR_FOREGROUND_A100)
+        blit_list.append((premium_text, (button_x + 15, info_y + 12)))
+        blit_list.append((version_text, (button_x + 15, info_y + 42)))
+        
+        self.screen.blits(blit_list, doreturn=False)
+        
+        self.dispatch_click(self._hit_zones[GameState.MAIN_MENU])
+    
+    def get_menu_block_sprite(self, size: int) -> pygame.Surface:
+        """Cached floating menu block"""
+        sprite = self._menu_block_sprites.get(size)
+        if sprite is None:
+            layers = []
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            s.fill((*COLOR_PURPLE, 60))
+            layers.append((s, (3, 3)))
+            
+            border = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(border, COLOR_PURPLE, (0, 0, size, size), 2, border_radius=8)
+            layers.append((border, (3, 3)))
+            
+            for i in range(2):
+                glow_size = size + i*6
+                glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+                pygame.draw.rect(glow_surf, (*COLOR_PURPLE, 20-i*10), (0, 0, glow_size, glow_size), border_radius=10)
+                layers.append((glow_surf, (3 - i*3, 3 - i*3)))
+            
+            sprite = pygame.Surface((size + 6, size + 6), pygame.SRCALPHA)
+            for layer, pos in layers:
+                sprite.blit(layer.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+            sprite = sprite.convert_alpha()
+            self._menu_block_sprites[size] = sprite
+        return sprite
     
     def draw_maps_screen(self):
         """Draw maps selection screen"""
@@ -956,204 +1576,178 @@ class BlockSmasher:
         self.draw_glow_text("SELECT MAP", self.font_large, COLOR_CYAN, 50, 30)
         
         # Back button
-        back_rect = pygame.Rect(50, 100, 140, 45)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(50, 100, 140, 45, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("← BACK", True, COLOR_CYAN)
+        back_text = self.render_text(self.font_small, "← BACK", COLOR_CYAN)
         self.screen.blit(back_text, (70, 110))
         
-        if back_hover and self.mouse_clicked:
-            self.state = GameState.MAIN_MENU
-        
         # Tab buttons
-        curated_rect = pygame.Rect(240, 100, 200, 45)
-        procedural_rect = pygame.Rect(460, 100, 220, 45)
-        
-        curated_hover = curated_rect.collidepoint(self.mouse_x, self.mouse_y)
-        procedural_hover = procedural_rect.collidepoint(self.mouse_x, self.mouse_y)
+        curated_hover = self._curated_tab_rect.collidepoint(self.mouse_x, self.mouse_y)
+        procedural_hover = self._procedural_tab_rect.collidepoint(self.mouse_x, self.mouse_y)
         
         self.draw_glass_rect(240, 100, 200, 45, COLOR_CYAN,
                            curated_hover or self.maps_tab == MapsTab.CURATED)
         self.draw_glass_rect(460, 100, 220, 45, COLOR_PURPLE,
                            procedural_hover or self.maps_tab == MapsTab.PROCEDURAL)
         
-        curated_text = self.font_small.render("CURATED", True, COLOR_CYAN)
-        procedural_text = self.font_small.render("PROCEDURAL", True, COLOR_PURPLE)
+        curated_text = self.render_text(self.font_small, "CURATED", COLOR_CYAN)
+        procedural_text = self.render_text(self.font_small, "PROCEDURAL", COLOR_PURPLE)
         self.screen.blit(curated_text, (275, 110))
         self.screen.blit(procedural_text, (490, 110))
         
-        if curated_hover and self.mouse_clicked:
-            self.maps_tab = MapsTab.CURATED
-        if procedural_hover and self.mouse_clicked:
-            self.maps_tab = MapsTab.PROCEDURAL
-        
         # Draw maps
         if self.maps_tab == MapsTab.CURATED:
             self.draw_curated_maps()
         else:
             self.draw_procedural_maps()
+        
+        self.dispatch_click(self._hit_zones[self.maps_tab])
     
-    def draw_curated_maps(self):
-        """Draw curated map cards"""
-        maps = [
-            (1, "First Steps", "Easy", 24),
-            (2, "Circular Formation", "Medium", 8),
-            (3, "Pyramid Power", "Medium", 36),
-            (4, "Checkerboard", "Hard", 32),
-            (5, "The Fortress", "Hard", 64),
-            (6, "Explosive Chaos", "Extreme", 80),
+    def draw_curated_card(self, surface: pygame.Surface, index: int, hover: bool, dx: int = 0, dy: int = 0):
+        """Draw one curated map card onto surface, shifted by (dx, dy)"""
+        level_id, name, difficulty, blocks = CURATED_MAPS[index]
+        x, y, card_rect = self._curated_card_rects[index]
+        x, y = x + dx, y + dy
+        card_width, card_height = card_rect.size
+        
+        locked = level_id not in self.unlocked_levels
+        color = (100, 100, 100) if locked else COLOR_CYAN
+        
+        surface.blit(self.get_glass_surface(card_width, card_height, color, hover, 12), (x - 6, y - 6),
+                     special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        # Level number, name and details
+        blit_list = [
+            (self.render_text(self.font_large, str(level_id), color), (x + 20, y + 15)),
+            (self.render_text(self.font_medium, name, COLOR_FOREGROUND if not locked else (150, 150, 150)), (x + 90, y + 20)),
+            (self.render_text(self.font_small, f"{difficulty} | {blocks} blocks", COLOR_PURPLE if not locked else (120, 120, 120)), (x + 90, y + 65)),
         ]
         
-        start_x, start_y = 50, 190
-        card_width, card_height = 400, 135
-        spacing = 25
+        # Lock icon
+        if locked:
+            lock_text = self.render_text(self.font_large, "🔒", (150, 150, 150))
+            blit_list.append((lock_text, lock_text.get_rect(center=(x + card_width // 2, y + card_height // 2))))
         
-        for i, (level_id, name, difficulty, blocks) in enumerate(maps):
-            row, col = i // 3, i % 3
-            x = start_x + col * (card_width + spacing)
-            y = start_y + row * (card_height + spacing)
-            
-            locked = level_id not in self.unlocked_levels
-            color = (100, 100, 100) if locked else COLOR_CYAN
-            
-            card_rect = pygame.Rect(x, y, card_width, card_height)
-            is_hover = card_rect.collidepoint(self.mouse_x, self.mouse_y) and not locked
-            
-            self.draw_glass_rect(x, y, card_width, card_height, color, is_hover)
-            
-            # Level number
-            level_text = self.font_large.render(str(level_id), True, color)
-            self.screen.blit(level_text, (x + 20, y + 15))
-            
-            # Name
-            name_text = self.font_medium.render(name, True, COLOR_FOREGROUND if not locked else (150, 150, 150))
-            self.screen.blit(name_text, (x + 90, y + 20))
-            
-            # Details
-            details_text = self.font_small.render(f"{difficulty} | {blocks} blocks", True, COLOR_PURPLE if not locked else (120, 120, 120))
-            self.screen.blit(details_text, (x + 90, y + 65))
-            
-            # Lock icon
-            if locked:
-                lock_text = self.font_large.render("🔒", True, (150, 150, 150))
-                lock_rect = lock_text.get_rect(center=(x + card_width // 2, y + card_height // 2))
-                self.screen.blit(lock_text, lock_rect)
-            
-            # Click handler
-            if is_hover and self.mouse_clicked:
-                self.start_level(level_id)
+        surface.blits(blit_list, doreturn=False)
+    
+    def build_curated_panel(self) -> pygame.Surface:
+        """Pre-render the idle curated cards"""
+        rect = self._curated_panel_rect
+        panel = pygame.Surface(rect.size).convert()
+        panel.fill(BG_DARK)
+        for i in range(len(CURATED_MAPS)):
+            self.draw_curated_card(panel, i, False, -rect.x, -rect.y)
+        return panel
+    
+    def draw_curated_maps(self):
+        """Draw curated map cards"""
+        key = tuple(level_id in self.unlocked_levels for level_id, *_ in CURATED_MAPS)
+        if key != self._curated_panel_key:
+            self._curated_panel = self.build_curated_panel()
+            self._curated_panel_key = key
+        self.screen.blit(self._curated_panel, self._curated_panel_rect)
+        
+        # Only the hovered (unlocked) card is redrawn, over a cleared patch
+        hovered = self.card_index_at(self.mouse_x, self.mouse_y, len(CURATED_MAPS), *CURATED_CARD_LAYOUT)
+        if hovered is not None and key[hovered]:
+            self.screen.fill(BG_DARK, self._curated_card_rects[hovered][2].inflate(12, 12))
+            self.draw_curated_card(self.screen, hovered, True)
     
     def draw_procedural_maps(self):
         """Draw procedural map cards"""
-        start_x, start_y = 50, 190
         card_width, card_height = 295, 120
-        spacing = 22
+        
+        # Card text is collected and blitted in one batch after the panels
+        blit_list = []
         
         for i in range(12):
-            level_id = 101 + i
-            row, col = i // 4, i % 4
-            x = start_x + col * (card_width + spacing)
-            y = start_y + row * (card_height + spacing)
-            
-            card_rect = pygame.Rect(x, y, card_width, card_height)
+            x, y, card_rect = self._procedural_card_rects[i]
             is_hover = card_rect.collidepoint(self.mouse_x, self.mouse_y)
             
             self.draw_glass_rect(x, y, card_width, card_height, COLOR_PURPLE, is_hover)
             
             # Icon and number
-            shuffle_text = self.font_large.render("🔀", True, COLOR_CYAN)
-            self.screen.blit(shuffle_text, (x + 15, y + 12))
+            shuffle_text = self.render_text(self.font_large, "🔀", COLOR_CYAN)
+            blit_list.append((shuffle_text, (x + 15, y + 12)))
             
-            num_text = self.font_large.render(str(i + 1), True, COLOR_PURPLE)
-            self.screen.blit(num_text, (x + 80, y + 15))
+            num_text = self.render_text(self.font_large, str(i + 1), COLOR_PURPLE)
+            blit_list.append((num_text, (x + 80, y + 15)))
             
             # Name
-            name_text = self.font_small.render(f"Random Level #{i + 1}", True, COLOR_FOREGROUND)
-            self.screen.blit(name_text, (x + 15, y + 60))
+            name_text = self.render_text(self.font_small, f"Random Level #{i + 1}", COLOR_FOREGROUND)
+            blit_list.append((name_text, (x + 15, y + 60)))
             
             # Difficulty
             difficulties = ['Easy', 'Medium', 'Hard', 'Expert']
             difficulty = difficulties[(i // 3) % 4]
-            diff_text = self.font_tiny.render(difficulty, True, COLOR_PURPLE)
-            self.screen.blit(diff_text, (x + 15, y + 90))
-            
-            # Click
-            if is_hover and self.mouse_clicked:
-                self.start_level(level_id)
-    
-    def draw_game_screen(self):
-        """Draw gameplay screen"""
-        self.screen.fill(BG_DARK)
-        
-        # Canvas
-        canvas_x = (SCREEN_WIDTH - CANVAS_WIDTH) // 2
-        canvas_y = (SCREEN_HEIGHT - CANVAS_HEIGHT) // 2 + 25
+            diff_text = self.render_text(self.font_tiny, difficulty, COLOR_PURPLE)
+            blit_list.append((diff_text, (x + 15, y + 90)))
         
-        # Canvas border with glow
-        for i in range(3):
-            glow_rect = pygame.Rect(canvas_x - 3 - i*2, canvas_y - 3 - i*2, CANVAS_WIDTH + 6 + i*4, CANVAS_HEIGHT + 6 + i*4)
-            pygame.draw.rect(self.screen, (*COLOR_CYAN, 60 - i*20), glow_rect, 2)
-        
-        # Canvas background
-        canvas_surface = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
-        canvas_surface.fill((15, 20, 35))
-        self.screen.blit(canvas_surface, (canvas_x, canvas_y))
-        
-        # Draw blocks
-        for block in self.blocks:
-            if block.alive:
-                bx, by = canvas_x + int(block.x), canvas_y + int(block.y)
-                pygame.draw.rect(self.screen, block.color, (bx, by, block.width, block.height), border_radius=4)
-                
-                # Block glow
-                s = pygame.Surface((int(block.width) + 4, int(block.height) + 4), pygame.SRCALPHA)
-                pygame.draw.rect(s, (*block.color, 80), (0, 0, int(block.width) + 4, int(block.height) + 4), 1, border_radius=5)
-                self.screen.blit(s, (bx - 2, by - 2))
+        self.screen.blits(blit_list, doreturn=False)
+    
+    def draw_game_world(self):
+        """Draw the playfield to the canvas"""
+        canvas = self._game_canvas
+        
+        # Blocks only change when one breaks, so they are composited into a layer that is
+        # copied wholesale under the moving sprites
+        if self._block_layer_version != self._blocks_version:
+            layer = self._block_layer
+            layer.fill((15, 20, 35))
+            get_block_sprite = self.get_block_sprite
+            block_blits = [(get_block_sprite(block.color, int(block.width), int(block.height)),
+                            (int(block.x) - 2, int(block.y) - 2))
+                           for block in self.blocks if block.alive]
+            layer.blits(block_blits, doreturn=False)
+            self._block_layer_version = self._blocks_version
+        canvas.blit(self._block_layer, (0, 0))
         
         # Draw paddle
         paddle_y = CANVAS_HEIGHT - 40
-        px, py = canvas_x + int(self.paddle_x), canvas_y + paddle_y
-        pygame.draw.rect(self.screen, COLOR_PURPLE, (px, py, self.paddle_width, self.paddle_height), border_radius=4)
-        
-        # Paddle glow
-        for i in range(3):
-            s = pygame.Surface((self.paddle_width + i*4, self.paddle_height + i*4), pygame.SRCALPHA)
-            pygame.draw.rect(s, (*COLOR_PURPLE, 50 - i*15), (0, 0, self.paddle_width + i*4, self.paddle_height + i*4), 1, border_radius=6)
-            self.screen.blit(s, (px - i*2, py - i*2))
+        paddle_sprite = self.get_paddle_sprite(self.paddle_width, self.paddle_height)
+        canvas.blit(paddle_sprite, (int(self.paddle_x) - 4, paddle_y - 4), special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Draw ball
-        ball_pos = (canvas_x + int(self.ball_x), canvas_y + int(self.ball_y))
-        pygame.draw.circle(self.screen, COLOR_CYAN, ball_pos, self.ball_radius)
-        
-        # Ball glow
-        for i in range(3):
-            s = pygame.Surface((self.ball_radius*2 + i*4, self.ball_radius*2 + i*4), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*COLOR_CYAN, 80 - i*25), (self.ball_radius + i*2, self.ball_radius + i*2), self.ball_radius + i*2, 1)
-            self.screen.blit(s, (ball_pos[0] - self.ball_radius - i*2, ball_pos[1] - self.ball_radius - i*2))
+        r = self.ball_radius
+        ball_sprite = self.get_ball_sprite(r)
+        canvas.blit(ball_sprite, (int(self.ball_x) - r - 4, int(self.ball_y) - r - 4),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Draw particles
-        for particle in self.particles:
-            if particle.life > 0:
-                alpha = int((particle.life / particle.max_life) * 255)
-                pos = (canvas_x + int(particle.x), canvas_y + int(particle.y))
-                size = max(1, int(particle.size * (particle.life / particle.max_life)))
-                s = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*particle.color, min(255, alpha)), (size, size), size)
-                self.screen.blit(s, (pos[0] - size, pos[1] - size))
+        get_sprite = self.get_particle_sprite
+        particle_blits = [(get_sprite(color, size, alpha), (px - size, py - size))
+                          for px, py, size, alpha, color in self.particles.visible()]
+        canvas.blits(particle_blits, doreturn=False)
+    
+    def draw_game_screen(self):
+        """Draw gameplay screen"""
+        self.screen.blit(self._game_bg, (0, 0))
+        
+        # Canvas (nothing moves after game over, so the last composite is reused)
+        canvas_x = (SCREEN_WIDTH - CANVAS_WIDTH) // 2
+        canvas_y = (SCREEN_HEIGHT - CANVAS_HEIGHT) // 2 + 25
+        if not (self.game_over_type and self._game_canvas_frozen):
+            self.draw_game_world()
+            self._game_canvas_frozen = bool(self.game_over_type)
+        self.screen.blit(self._game_canvas, (canvas_x, canvas_y))
         
         # HUD
-        level_text = f"Random Level #{self.current_level - 99}" if self.current_level >= 100 else f"Level {self.current_level}"
-        hud = self.font_small.render(f"{level_text} | Score: {self.score} | Lives: {self.lives}", True, COLOR_FOREGROUND)
-        self.screen.blit(hud, (50, 25))
+        hud_key = (self.current_level, self.score, self.lives)
+        if hud_key != self._hud_key:
+            level_text = f"Random Level #{self.current_level - 99}" if self.current_level >= 100 else f"Level {self.current_level}"
+            self._hud_surf = self.font_small.render(f"{level_text} | Score: {self.score} | Lives: {self.lives}",
+                                                    True, COLOR_FOREGROUND).convert_alpha()
+            self._hud_key = hud_key
+        self.screen.blit(self._hud_surf, (50, 25))
         
         # FPS
         if self.settings.show_fps:
-            fps_text = self.font_small.render(f"FPS: {self.fps_counter}", True, COLOR_ORANGE)
+            fps_text = self.render_text(self.font_small, f"FPS: {self.fps_counter}", COLOR_ORANGE)
             self.screen.blit(fps_text, (SCREEN_WIDTH - 120, 25))
         
         # Launch hint
         if not self.ball_launched:
-            hint = self.font_small.render("SPACE or CLICK to launch", True, COLOR_CYAN)
+            hint = self.render_text(self.font_small, "SPACE or CLICK to launch", COLOR_CYAN)
             hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45))
             self.screen.blit(hint, hint_rect)
         
@@ -1162,14 +1756,64 @@ class BlockSmasher:
             self.draw_game_over_overlay()
         
         # Back/Pause button
-        pause_rect = pygame.Rect(50, 75, 65, 45)
-        pause_hover = pause_rect.collidepoint(self.mouse_x, self.mouse_y)
+        pause_hover = self._pause_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(50, 75, 65, 45, COLOR_ORANGE, pause_hover)
-        pause_text = self.font_medium.render("⏸", True, COLOR_ORANGE)
+        pause_text = self.render_text(self.font_medium, "⏸", COLOR_ORANGE)
         self.screen.blit(pause_text, (65, 80))
         
-        if pause_hover and self.mouse_clicked:
-            self.state = GameState.MAPS_SCREEN
+        self.dispatch_click(self._hit_zones['game_over' if self.game_over_type else GameState.GAME_SCREEN])
+    
+    def get_particle_sprite(self, color: Tuple[int, int, int], size: int, alpha: int) -> pygame.Surface:
+        """Cached particle circle"""
+        key = (color, size, alpha)
+        sprite = self._particle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+            sprite = sprite.convert_alpha()
+            self._particle_sprites[key] = sprite
+        return sprite
+    
+    def get_block_sprite(self, color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+        """Cached block sprite"""
+        key = (color, width, height)
+        sprite = self._block_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, color, (2, 2, width, height), border_radius=4)
+            pygame.draw.rect(sprite, (*color, 80), (0, 0, width + 4, height + 4), 1, border_radius=5)
+            sprite = sprite.convert_alpha()
+            self._block_sprites[key] = sprite
+        return sprite
+    
+    def get_paddle_sprite(self, width: int, height: int) -> pygame.Surface:
+        """Cached paddle sprite"""
+        key = (width, height)
+        sprite = self._paddle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width + 8, height + 8), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, COLOR_PURPLE, (4, 4, width, height), border_radius=4)
+            for i in range(3):
+                glow = pygame.Surface((width + i*4, height + i*4), pygame.SRCALPHA)
+                pygame.draw.rect(glow, (*COLOR_PURPLE, 50 - i*15), (0, 0, width + i*4, height + i*4), 1, border_radius=6)
+                sprite.blit(glow.premul_alpha(), (4 - i*2, 4 - i*2), special_flags=pygame.BLEND_PREMULTIPLIED)
+            sprite = sprite.convert_alpha()
+            self._paddle_sprites[key] = sprite
+        return sprite
+    
+    def get_ball_sprite(self, radius: int) -> pygame.Surface:
+        """Cached ball sprite"""
+        sprite = self._ball_sprites.get(radius)
+        if sprite is None:
+            sprite = pygame.Surface((radius*2 + 8, radius*2 + 8), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, COLOR_CYAN, (radius + 4, radius + 4), radius)
+            for i in range(3):
+                glow = pygame.Surface((radius*2 + i*4, radius*2 + i*4), pygame.SRCALPHA)
+                pygame.draw.circle(glow, (*COLOR_CYAN, 80 - i*25), (radius + i*2, radius + i*2), radius + i*2, 1)
+                sprite.blit(glow.premul_alpha(), (4 - i*2, 4 - i*2), special_flags=pygame.BLEND_PREMULTIPLIED)
+            sprite = sprite.convert_alpha()
+            self._ball_sprites[radius] = sprite
+        return sprite
     
     def draw_game_over_overlay(self):
         """Draw victory/defeat overlay"""
@@ -1177,27 +1821,29 @@ class BlockSmasher:
         overlay.fill((0, 0, 0, 200))
         self.screen.blit(overlay, (0, 0))
         
+        # Text is collected and blitted in one batch after the buttons
+        blit_list = []
+        
         if self.game_over_type == 'victory':
             self.draw_glow_text("VICTORY!", self.font_title, COLOR_CYAN, SCREEN_WIDTH // 2, 240, center=True)
-            stars = self.font_large.render("★ ★ ★", True, COLOR_YELLOW)
+            stars = self.render_text(self.font_large, "★ ★ ★", COLOR_YELLOW)
             stars_rect = stars.get_rect(center=(SCREEN_WIDTH // 2, 330))
-            self.screen.blit(stars, stars_rect)
+            blit_list.append((stars, stars_rect))
         else:
             self.draw_glow_text("GAME OVER", self.font_title, COLOR_ORANGE, SCREEN_WIDTH // 2, 240, center=True)
         
         # Score
-        score_text = self.font_medium.render(f"Final Score: {self.score}", True, COLOR_FOREGROUND)
+        score_text = self.render_text(self.font_medium, f"Final Score: {self.score}", COLOR_FOREGROUND)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 410))
-        self.screen.blit(score_text, score_rect)
+        blit_list.append((score_text, score_rect))
         
         # Saved message
-        saved_text = self.font_small.render("Score saved to leaderboard!", True, COLOR_SUCCESS)
+        saved_text = self.render_text(self.font_small, "Score saved to leaderboard!", COLOR_SUCCESS)
         saved_rect = saved_text.get_rect(center=(SCREEN_WIDTH // 2, 460))
-        self.screen.blit(saved_text, saved_rect)
+        blit_list.append((saved_text, saved_rect))
         
         # Buttons
-        retry_rect = pygame.Rect(SCREEN_WIDTH // 2 - 230, 520, 210, 65)
-        menu_rect = pygame.Rect(SCREEN_WIDTH // 2 + 20, 520, 210, 65)
+        retry_rect, menu_rect = self._overlay_button_rects
         
         retry_hover = retry_rect.collidepoint(self.mouse_x, self.mouse_y)
         menu_hover = menu_rect.collidepoint(self.mouse_x, self.mouse_y)
@@ -1205,38 +1851,32 @@ class BlockSmasher:
         self.draw_glass_rect(retry_rect.x, retry_rect.y, retry_rect.width, retry_rect.height, COLOR_PURPLE, retry_hover)
         self.draw_glass_rect(menu_rect.x, menu_rect.y, menu_rect.width, menu_rect.height, COLOR_CYAN, menu_hover)
         
-        retry_text = self.font_medium.render("RETRY", True, COLOR_PURPLE)
-        menu_text = self.font_medium.render("MENU", True, COLOR_CYAN)
+        retry_text = self.render_text(self.font_medium, "RETRY", COLOR_PURPLE)
+        menu_text = self.render_text(self.font_medium, "MENU", COLOR_CYAN)
         retry_text_rect = retry_text.get_rect(center=retry_rect.center)
         menu_text_rect = menu_text.get_rect(center=menu_rect.center)
-        self.screen.blit(retry_text, retry_text_rect)
-        self.screen.blit(menu_text, menu_text_rect)
+        blit_list.append((retry_text, retry_text_rect))
+        blit_list.append((menu_text, menu_text_rect))
         
-        if retry_hover and self.mouse_clicked:
-            self.start_level(self.current_level)
-        if menu_hover and self.mouse_clicked:
-            self.state = GameState.MAPS_SCREEN
+        self.screen.blits(blit_list, doreturn=False)
     
     def draw_settings_screen(self):
         """Draw settings screen"""
         self.screen.fill(BG_DARK)
         
+        # Text is collected and blitted in one batch after the panels
+        blit_list = []
+        
         self.draw_glow_text("SETTINGS", self.font_large, COLOR_CYAN, 50, 30)
         
         # Back button
-        back_rect = pygame.Rect(50, 100, 140, 45)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(50, 100, 140, 45, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("← BACK", True, COLOR_CYAN)
-        self.screen.blit(back_text, (70, 110))
-        
-        if back_hover and self.mouse_clicked:
-            self.state = GameState.MAIN_MENU
+        back_text = self.render_text(self.font_small, "← BACK", COLOR_CYAN)
+        blit_list.append((back_text, (70, 110)))
         
         # Settings
-        y = 210
-        spacing = 80
-        
+
         settings_items = [
             f"Particle Effects: {'ON' if self.settings.particle_effects else 'OFF'}",
             f"Screen Shake: {'ON' if self.settings.screen_shake else 'OFF'}",
@@ -1246,22 +1886,18 @@ class BlockSmasher:
         ]
         
         for i, item in enumerate(settings_items):
-            item_y = y + i * spacing
-            item_rect = pygame.Rect(SCREEN_WIDTH // 2 - 280, item_y, 560, 65)
+            item_rect = self._settings_item_rects[i]
             item_hover = item_rect.collidepoint(self.mouse_x, self.mouse_y)
             
             self.draw_glass_rect(item_rect.x, item_rect.y, item_rect.width, item_rect.height, COLOR_PURPLE, item_hover)
             
-            item_text = self.font_medium.render(item, True, COLOR_FOREGROUND)
+            item_text = self.render_text(self.font_medium, item, COLOR_FOREGROUND)
             item_text_rect = item_text.get_rect(center=item_rect.center)
-            self.screen.blit(item_text, item_text_rect)
-            
-            # Toggle particle effects
-            if i == 0 and item_hover and self.mouse_clicked:
-                self.settings.particle_effects = not self.settings.particle_effects
-            # Toggle show FPS
-            elif i == 2 and item_hover and self.mouse_clicked:
-                self.settings.show_fps = not self.settings.show_fps
+            blit_list.append((item_text, item_text_rect))
+        
+        self.screen.blits(blit_list, doreturn=False)
+        
+        self.dispatch_click(self._hit_zones[GameState.SETTINGS_SCREEN])
     
     def draw_leaderboard_screen(self):
         """Draw leaderboard screen with real data"""
@@ -1270,41 +1906,56 @@ class BlockSmasher:
         self.draw_glow_text("LEADERBOARD", self.font_large, COLOR_CYAN, 50, 30)
         
         # Back button
-        back_rect = pygame.Rect(50, 100, 140, 45)
-        back_hover = back_rect.collidepoint(self.mouse_x, self.mouse_y)
+        back_hover = self._back_rect.collidepoint(self.mouse_x, self.mouse_y)
         self.draw_glass_rect(50, 100, 140, 45, COLOR_CYAN, back_hover)
-        back_text = self.font_small.render("← BACK", True, COLOR_CYAN)
+        back_text = self.render_text(self.font_small, "← BACK", COLOR_CYAN)
         self.screen.blit(back_text, (70, 110))
         
-        if back_hover and self.mouse_clicked:
-            self.state = GameState.MAIN_MENU
+        self.dispatch_click(self._hit_zones[GameState.LEADERBOARD_SCREEN])
+        
+        # Podium and score list, re-rendered only when the leaderboard changes
+        version = self.data_manager.leaderboard_version
+        if self._lb_panel is None or self._lb_panel_version != version:
+            self._lb_panel = self.build_leaderboard_panel()
+            self._lb_panel_version = version
+        self.screen.blit(self._lb_panel, (0, LEADERBOARD_PANEL_Y))
+    
+    def build_leaderboard_panel(self) -> pygame.Surface:
+        """Pre-render the leaderboard body"""
+        top = LEADERBOARD_PANEL_Y
+        panel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - top)).convert()
+        panel.fill(BG_DARK)
+        
+        def glass(x, y, width, height, color, glow=False):
+            panel.blit(self.get_glass_surface(width, height, color, glow, 12), (x - 6, y - 6 - top),
+                       special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Get top scores
         top_scores = self.data_manager.get_top_scores(10)
         
         if not top_scores:
             # No scores yet
-            no_scores_text = self.font_medium.render("No scores yet. Play to get on the leaderboard!", True, COLOR_FOREGROUND)
-            no_scores_rect = no_scores_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            self.screen.blit(no_scores_text, no_scores_rect)
-            return
+            no_scores_text = self.render_text(self.font_medium, "No scores yet. Play to get on the leaderboard!", COLOR_FOREGROUND)
+            no_scores_rect = no_scores_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - top))
+            panel.blit(no_scores_text, no_scores_rect)
+            return panel
         
         # Top 3 podium
         if len(top_scores) > 0:
             podium_y = 220
-            self.draw_glass_rect(SCREEN_WIDTH // 2 - 140, podium_y, 280, 160, COLOR_YELLOW, True)
+            glass(SCREEN_WIDTH // 2 - 140, podium_y, 280, 160, COLOR_YELLOW, True)
             
-            first_text = self.font_title.render("1", True, COLOR_YELLOW)
-            first_rect = first_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 45))
-            self.screen.blit(first_text, first_rect)
+            first_text = self.render_text(self.font_title, "1", COLOR_YELLOW)
+            first_rect = first_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 45 - top))
+            panel.blit(first_text, first_rect)
             
-            name_text = self.font_medium.render(top_scores[0].username, True, COLOR_FOREGROUND)
-            name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 100))
-            self.screen.blit(name_text, name_rect)
+            name_text = self.render_text(self.font_medium, top_scores[0].username, COLOR_FOREGROUND)
+            name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 100 - top))
+            panel.blit(name_text, name_rect)
             
-            score_text = self.font_small.render(f"{top_scores[0].score:,} pts | Level {top_scores[0].level}", True, COLOR_CYAN)
-            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 130))
-            self.screen.blit(score_text, score_rect)
+            score_text = self.render_text(self.font_small, f"{format_points(top_scores[0].score)} | Level {top_scores[0].level}", COLOR_CYAN)
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, podium_y + 130 - top))
+            panel.blit(score_text, score_rect)
         
         # Rest of leaderboard
         list_y = 420
@@ -1313,21 +1964,22 @@ class BlockSmasher:
                 break
             
             entry_y = list_y + (i - 1) * 60
-            self.draw_glass_rect(SCREEN_WIDTH // 2 - 320, entry_y, 640, 52, COLOR_PURPLE)
+            glass(SCREEN_WIDTH // 2 - 320, entry_y, 640, 52, COLOR_PURPLE)
             
-            rank_text = self.font_medium.render(f"#{i + 1}", True, COLOR_CYAN)
-            self.screen.blit(rank_text, (SCREEN_WIDTH // 2 - 295, entry_y + 12))
+            rank_text = self.render_text(self.font_medium, f"#{i + 1}", COLOR_CYAN)
+            panel.blit(rank_text, (SCREEN_WIDTH // 2 - 295, entry_y + 12 - top))
             
-            name_text = self.font_medium.render(entry.username, True, COLOR_FOREGROUND)
-            self.screen.blit(name_text, (SCREEN_WIDTH // 2 - 210, entry_y + 12))
+            name_text = self.render_text(self.font_medium, entry.username, COLOR_FOREGROUND)
+            panel.blit(name_text, (SCREEN_WIDTH // 2 - 210, entry_y + 12 - top))
             
-            score_text = self.font_medium.render(f"{entry.score:,} pts", True, COLOR_ORANGE)
-            score_rect = score_text.get_rect(right=SCREEN_WIDTH // 2 + 300, centery=entry_y + 26)
-            self.screen.blit(score_text, score_rect)
+            score_text = self.render_text(self.font_medium, format_points(entry.score), COLOR_ORANGE)
+            score_rect = score_text.get_rect(right=SCREEN_WIDTH // 2 + 300, centery=entry_y + 26 - top)
+            panel.blit(score_text, score_rect)
             
-            level_text = self.font_small.render(f"Lvl {entry.level}", True, (*COLOR_FOREGROUND, 150))
-            level_rect = level_text.get_rect(right=SCREEN_WIDTH // 2 + 190, centery=entry_y + 26)
-            self.screen.blit(level_text, level_rect)
+            level_text = self.render_text(self.font_small, f"Lvl {entry.level}", COLOR_FOREGROUND_A150)
+            level_rect = level_text.get_rect(right=SCREEN_WIDTH // 2 + 190, centery=entry_y + 26 - top)
+            panel.blit(level_text, level_rect)
+        return panel
     
     def handle_text_input(self, event):
         """Handle text input for login/register"""
@@ -1357,93 +2009,211 @@ class BlockSmasher:
                     self.current_user = self.username_input
                     self.username_input = ""
                     self.password_input = ""
-                    pygame.time.wait(500)
-                    self.state = GameState.MAIN_MENU
+                    self.schedule_state(GameState.MAIN_MENU, 0.5)
                 else:
                     self.error_message = message
                     self.success_message = ""
+    
+    def handle_game_key(self, event):
+        """Handle gameplay keys"""
+        if event.key == pygame.K_SPACE:
+            self.try_launch_ball()
+        elif event.key == pygame.K_ESCAPE:
+            self.state = GameState.MAPS_SCREEN
+    
+    def handle_menu_key(self, event):
+        """Handle menu keys: Escape returns to the main menu"""
+        if event.key == pygame.K_ESCAPE:
+            self.state = GameState.MAIN_MENU
+    
+    def handle_typed_text(self, text: str):
+        """Append typed text to the field"""
+        if self.input_active == "username":
+            self.username_input = (self.username_input + text)[:20]
+        elif self.input_active == "password":
+            self.password_input = (self.password_input + text)[:PASSWORD_MAX_LENGTH]
+    
+    def sync_text_input(self):
+        """Toggle SDL text input"""
+        wanted = self.state in AUTH_SCREENS
+        if wanted == self._text_input_on:
+            return
+        self._text_input_on = wanted
+        if wanted:
+            rects = self._login_rects if self.state == GameState.LOGIN else self._register_rects
+            pygame.key.start_text_input()
+            pygame.key.set_text_input_rect(rects[0])
         else:
-            # Add character
-            if event.unicode.isprintable() and len(event.unicode) == 1:
-                if self.input_active == "username" and len(self.username_input) < 20:
-                    self.username_input += event.unicode
-                elif self.input_active == "password" and len(self.password_input) < 30:
-                    self.password_input += event.unicode
-    
-    def handle_events(self):
+            pygame.key.stop_text_input()
+    
+    def wait_for_events(self, timeout_ms: int) -> list:
+        """Block until input or timeout"""
+        # event.wait() is this frame's only pump; anything else reading events uses pump=False
+        event = pygame.event.wait(timeout_ms)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get(pump=False)
+    
+    def handle_events(self, events: Optional[list] = None):
         """Handle pygame events"""
         self.mouse_clicked = False
+        self.sync_text_input()
+        if events is None:
+            # The frame's single SDL pump; other event reads pass pump=False and key state
+            # comes from key.get_pressed(), which never pumps
+            pygame.event.pump()
+            # No type filter: a filtered get returns events grouped by type rather than in
+            # arrival order, and set_allowed already keeps unhandled types out of the queue
+            events = pygame.event.get(pump=False)
+        if not events:
+            return
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        # Local aliases keep the per-event comparisons off the module/global lookup path
+        MOUSEMOTION, MOUSEBUTTONDOWN, KEYDOWN, TEXTINPUT, QUIT = (
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.QUIT)
+        auth_screens = AUTH_SCREENS
+        key_handlers = self._key_handlers
+        
+        # Any input may change what a static screen shows
+        self._dirty = True
+        
+        for event in events:
+            event_type = event.type
             
-            elif event.type == pygame.MOUSEMOTION:
+            # Motion is by far the most frequent event, so it is tested first
+            if event_type == MOUSEMOTION:
                 self.mouse_x, self.mouse_y = event.pos
             
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+            elif event_type == MOUSEBUTTONDOWN:
                 self.mouse_clicked = True
-                
-                if self.state == GameState.GAME_SCREEN and not self.game_over_type:
-                    if not self.ball_launched:
-                        self.ball_launched = True
-                        self.ball_vx = random.uniform(-3, 3)
-                        self.ball_vy = -6
+                self.try_launch_ball()
             
-            elif event.type == pygame.KEYDOWN:
-                # Handle text input for login/register screens
-                if self.state in [GameState.LOGIN, GameState.REGISTER]:
-                    self.handle_text_input(event)
-                
-                # Game controls
-                elif event.key == pygame.K_SPACE:
-                    if self.state == GameState.GAME_SCREEN and not self.game_over_type:
-                        if not self.ball_launched:
-                            self.ball_launched = True
-                            self.ball_vx = random.uniform(-3, 3)
-                            self.ball_vy = -6
-                
-                elif event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.GAME_SCREEN:
-                        self.state = GameState.MAPS_SCREEN
-                    elif self.state not in [GameState.LOGIN, GameState.REGISTER]:
-                        self.state = GameState.MAIN_MENU
+            elif event_type == TEXTINPUT:
+                if self.state in auth_screens:
+                    self.handle_typed_text(event.text)
+            
+            elif event_type == KEYDOWN:
+                # Looked up per event since a key can switch screens mid-batch
+                key_handlers[self.state](event)
+            
+            elif event_type == QUIT:
+                self.running = False
+            
+            else:
+                # Window exposed: the last presented frame is gone
+                self._last_ui_signature = None
     
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            self.time += 0.016
-            self.handle_events()
+    def wait_for_next_frame(self, presented: bool = False) -> float:
+        """Pace to the next frame"""
+        # Returns the real seconds since the previous frame
+        if self._vsync and presented:
+            # flip() already blocked until vblank, so the display paces this frame
+            now = time.perf_counter()
+            self._next_frame = now
+        else:
+            target = self._next_frame + FIXED_DT
+            slack = target - time.perf_counter()
+            if slack > SPIN_MARGIN:
+                time.sleep(slack - SPIN_MARGIN)
+            now = time.perf_counter()
+            while now < target:
+                now = time.perf_counter()
+            
+            # After a stall, restart the schedule from now rather than rushing frames to catch up
+            self._next_frame = target if now - target < FIXED_DT else now
+        
+        # Smoothed FPS readout, refreshed twice a second
+        dt = now - self._last_frame
+        self._last_frame = now
+        self._frame_time_ema += (dt - self._frame_time_ema) * 0.1
+        if self._vsync and self._frame_time_ema < MIN_VSYNC_FRAME:
+            self._vsync = False
+        if now - self._last_fps_sample >= 0.5:
+            self.fps_counter = int(round(1 / self._frame_time_ema))
+            self._last_fps_sample = now
+        return dt
+    
+    def step_simulation(self):
+        """Run pending fixed steps"""
+        while self._accum >= FIXED_DT:
+            if self.state == GameState.GAME_SCREEN:
+                self.update_game()
+            self._accum -= FIXED_DT
+            self.time += FIXED_DT
+        
+        # Apply a delayed screen switch once it is due; navigating away in the meantime cancels it
+        if self._pending_state:
+            from_state, to_state, due = self._pending_state
+            if self.state != from_state:
+                self._pending_state = None
+            elif self.time >= due:
+                self.state = to_state
+                self._pending_state = None
+                self._dirty = True
+    
+    def render_frame(self) -> bool:
+        """Draw and present the frame if needed"""
+        # Returns whether a frame was presented, which the pacer needs
+        # Static screens are only rechecked after input and keep last frame's pixels until
+        # something they show changes; clicks always go through since their handlers run
+        # inside the draw methods
+        if not self._dirty and self.state in STATIC_SCREENS:
+            return False
+        presented = False
+        signature = self.ui_signature()
+        if signature is None or signature != self._last_ui_signature or self.mouse_clicked:
+            self._last_ui_signature = signature
             
             # Clear screen
             self.screen.fill(BG_DARK)
             
             # Draw current screen
-            if self.state == GameState.LOGIN:
-                self.draw_login_screen()
-            elif self.state == GameState.REGISTER:
-                self.draw_register_screen()
-            elif self.state == GameState.MAIN_MENU:
-                self.draw_main_menu()
-            elif self.state == GameState.MAPS_SCREEN:
-                self.draw_maps_screen()
-            elif self.state == GameState.GAME_SCREEN:
-                self.update_game()
-                self.draw_game_screen()
-            elif self.state == GameState.SETTINGS_SCREEN:
-                self.draw_settings_screen()
-            elif self.state == GameState.LEADERBOARD_SCREEN:
-                self.draw_leaderboard_screen()
+            self._draw_dispatch[self.state]()
             
             # Update display
             pygame.display.flip()
-            
-            # Track FPS
-            self.clock.tick(FPS)
-            self.fps_counter = int(self.clock.get_fps())
+            presented = True
         
-        pygame.quit()
-        sys.exit()
+        # A click may have switched screens mid-draw, so look again next frame
+        self._dirty = self.mouse_clicked
+        return presented
+    
+    def run(self):
+        """Main game loop"""
+        # Pending writes are flushed even if the loop dies with an exception
+        try:
+            while self.running:
+                # An idle static screen has nothing to redraw, so block in SDL until input arrives
+                if self._dirty or self.state not in STATIC_SCREENS:
+                    self.handle_events()
+                else:
+                    self.handle_events(self.wait_for_events(IDLE_WAIT_MS))
+                
+                self.step_simulation()
+                presented = self.render_frame()
+                
+                # Persist deferred data writes at most every 500 ms, before pacing so the write
+                # eats into this frame's sleep instead of delaying the next frame's input
+                now = pygame.time.get_ticks()
+                if now - self._last_flush >= 500:
+                    self.data_manager.flush()
+                    self._last_flush = now
+                
+                # Cap frame rate and bank the elapsed real time for the next frame's steps
+                self._accum += min(self.wait_for_next_frame(presented), MAX_FRAME_DT)
+        finally:
+            self.data_manager.flush()
+        
+        if DEBUG:
+            pygame.quit()
+            sys.exit()
+        
+        # Saved data is already on disk, so close the window and skip the slow full teardown
+        pygame.display.quit()
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        sys.stdout.flush()
+        os._exit(0)
 
 if __name__ == "__main__":
     game = BlockSmasher()
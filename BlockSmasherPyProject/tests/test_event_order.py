@@ -0,0 +1,72 @@
+"""Event batches must be applied in the order they arrived"""
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["BLOCK_SMASHER_DEBUG"] = "1"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+import block_smasher_final as game
+
+
+def key(k: int, uni: str = "") -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=k, mod=0, unicode=uni, scancode=0)
+
+
+def text(s: str) -> pygame.event.Event:
+    return pygame.event.Event(pygame.TEXTINPUT, text=s)
+
+
+class EventOrderTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.game = game.BlockSmasher()
+        self.game.handle_events()
+        self.game.state = game.GameState.LOGIN
+        self.game.input_active = "username"
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def post(self, *events):
+        for event in events:
+            pygame.event.post(event)
+
+    def test_text_and_editing_keys_interleave(self):
+        self.post(text("bob"), key(pygame.K_TAB, "\t"), text("pasx"), key(pygame.K_BACKSPACE, "\b"), text("s"))
+        self.game.handle_events()
+        self.assertEqual(self.game.username_input, "bob")
+        self.assertEqual(self.game.password_input, "pass")
+
+    def test_waited_batch_keeps_order(self):
+        self.post(text("ab"), key(pygame.K_TAB, "\t"), text("cd"))
+        self.game.handle_events(self.game.wait_for_events(10))
+        self.assertEqual((self.game.username_input, self.game.password_input), ("ab", "cd"))
+
+    def test_return_submits_text_typed_before_it(self):
+        self.game.data_manager.register_user("carol", "secret")
+        self.post(text("carol"), key(pygame.K_TAB, "\t"), text("secret"), key(pygame.K_RETURN, "\r"))
+        self.game.handle_events()
+        self.assertEqual(self.game.state, game.GameState.MAIN_MENU)
+        self.assertEqual(self.game.current_user, "carol")
+
+    def test_click_uses_its_own_position(self):
+        self.game.state = game.GameState.MAIN_MENU
+        seen = []
+        self.game.try_launch_ball = lambda: seen.append((self.game.mouse_x, self.game.mouse_y))
+        self.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(0, 0), buttons=(0, 0, 0)),
+                  pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 10), button=1),
+                  pygame.event.Event(pygame.MOUSEMOTION, pos=(900, 700), rel=(0, 0), buttons=(0, 0, 0)))
+        self.game.handle_events()
+        self.assertEqual(seen, [(10, 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()